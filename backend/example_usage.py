@@ -3,10 +3,35 @@ MPIF Converter Example - Recreate test.mpif
 
 This example shows how to build MPIF JSON from arguments,
 including characterization data, then convert to MPIF format.
+
+Pass --verify to check the streamed checksum against json_to_mpif() and parse
+the generated MPIF back into JSON as a round-trip check, and --pretty to write
+output.json indented instead of compact.
 """
 
-from mpif_converter import create_mpif_json, json_to_mpif
-import json
+from mpif_converter import create_mpif_json, json_to_mpif, json_to_mpif_iter, mpif_to_json
+from mpif_analytics import integrate_tga, tga_arrays
+import hashlib
+import sys
+from pathlib import Path
+
+verify = '--verify' in sys.argv[1:]
+pretty = '--pretty' in sys.argv[1:]
+
+
+def _dump_json(data, path, pretty=False):
+    """Write data as JSON, using orjson when installed (imported on first use)."""
+    try:
+        import orjson
+    except ImportError:  # orjson is optional; fall back to the stdlib encoder
+        import json
+        if pretty:
+            Path(path).write_text(json.dumps(data, indent=2))
+        else:
+            Path(path).write_text(json.dumps(data, separators=(',', ':')))
+        return
+    option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if pretty else 0)
+    Path(path).write_bytes(orjson.dumps(data, option=option))
 
 # =============================================================================
 # Build complete MPIF JSON structure from arguments (single function call!)
@@ -220,42 +245,59 @@ data = create_mpif_json(
     }
 )
 
+pi = data['productInfo']
+sd = data['synthesisDetails']
+ch = data['characterization']
+cif = pi['cif']
+
 print(f"✓ Created complete JSON structure in one call!")
-print(f"  Material: {data['productInfo']['commonName']}")
-print(f"  Substrates: {len(data['synthesisDetails']['substrates'])} (IDs: {[s['id'] for s in data['synthesisDetails']['substrates']]})")
-print(f"  Solvents: {len(data['synthesisDetails']['solvents'])} (IDs: {[s['id'] for s in data['synthesisDetails']['solvents']]})")
-print(f"  Vessels: {len(data['synthesisDetails']['vessels'])} (IDs: {[v['id'] for v in data['synthesisDetails']['vessels']]})")
-print(f"  Hardware: {len(data['synthesisDetails']['hardware'])} (IDs: {[h['id'] for h in data['synthesisDetails']['hardware']]})")
-print(f"  Steps: {len(data['synthesisDetails']['steps'])} (IDs: {[s['id'] for s in data['synthesisDetails']['steps']]})")
-print(f"  PXRD: {len(data['characterization']['pxrd']['data'])} points")
-print(f"  TGA: {len(data['characterization']['tga']['data'])} points")
-print(f"  AIF: {len(data['characterization']['aif']['adsorptionData'])} points")
-print(f"  CIF: {len(data['productInfo']['cif']['properties'])} properties, {len(data['productInfo']['cif']['loops'])} loops")
+print(f"  Material: {pi['commonName']}")
+for label, key in (('Substrates', 'substrates'), ('Solvents', 'solvents'), ('Vessels', 'vessels'),
+                   ('Hardware', 'hardware'), ('Steps', 'steps')):
+    items = sd[key]
+    print(f"  {label}: {len(items)} (IDs: {[item['id'] for item in items]})")
+print(f"  PXRD: {len(ch['pxrd']['data'])} points")
+print(f"  TGA: {len(ch['tga']['data'])} points "
+      f"(integrated area: {integrate_tga(*tga_arrays(ch['tga'])):.1f} %·°C)")
+print(f"  AIF: {len(ch['aif']['adsorptionData'])} points")
+print(f"  CIF: {len(cif['properties'])} properties, {len(cif['loops'])} loops")
 
 # =============================================================================
 # Save JSON and convert to MPIF
 # =============================================================================
 print("\nSaving JSON...")
-with open('output.json', 'w') as f:
-    json.dump(data, f, indent=2)
+_dump_json(data, 'output.json', pretty)
 print(f"✓ Saved to output.json")
 
 print("\nConverting to MPIF...")
-mpif_output = json_to_mpif(data)
-with open('output.mpif', 'w') as f:
-    f.write(mpif_output)
-print(f"✓ Saved to output.mpif ({len(mpif_output)} characters)")
+# Stream sections straight to disk, counting and hashing as they are written
+# (SHA-256, the same digest json_to_mpif(data, return_digest=True) gives)
+checksum = hashlib.sha256()
+n_chars = 0
+with open('output.mpif', 'w', encoding='utf-8') as f:
+    for chunk in json_to_mpif_iter(data):
+        n_chars += f.write(chunk)
+        checksum.update(chunk.encode())
+print(f"✓ Saved to output.mpif ({n_chars} characters)")
+print(f"  SHA-256: {checksum.hexdigest()}")
 
 # =============================================================================
-# Verify round-trip conversion
+# Verify output (checksum and full round-trip parse only with --verify)
 # =============================================================================
-print("\nVerifying round-trip...")
-from mpif_converter import mpif_to_json
-data_roundtrip = mpif_to_json(mpif_output)
-print(f"✓ Round-trip successful")
-print(f"  Material: {data_roundtrip['productInfo']['commonName']}")
-print(f"  Substrates: {len(data_roundtrip['synthesisDetails']['substrates'])}")
-print(f"  PXRD points: {len(data_roundtrip['characterization']['pxrd']['data'])}")
+if verify:
+    print("\nVerifying checksum...")
+    _, digest = json_to_mpif(data, return_digest=True)
+    if digest != checksum.hexdigest():
+        sys.exit("✗ Streamed MPIF does not match json_to_mpif() output")
+    print(f"✓ Checksum matches json_to_mpif(data, return_digest=True)")
+    
+    print("\nVerifying round-trip...")
+    with open('output.mpif') as f:
+        data_roundtrip = mpif_to_json(f)
+    print(f"✓ Round-trip successful")
+    print(f"  Material: {data_roundtrip['productInfo']['commonName']}")
+    print(f"  Substrates: {len(data_roundtrip['synthesisDetails']['substrates'])}")
+    print(f"  PXRD points: {len(data_roundtrip['characterization']['pxrd']['data'])}")
 
 # =============================================================================
 # Summary
@@ -269,8 +311,7 @@ print("""
   - Characterization data included directly (PXRD, TGA, AIF, CIF)
 ✓ Saved JSON to output.json
 ✓ Converted to MPIF and saved to output.mpif
-✓ Verified round-trip conversion
-
+""" + ("✓ Verified round-trip conversion\n" if verify else "") + """
 Files created:
 - output.json (JSON format)
 - output.mpif (MPIF format, matches test.mpif structure)
@@ -0,0 +1,143 @@
+"""
+MPIF Analytics Module
+
+Numeric helpers for characterization data produced by mpif_converter
+(PXRD, TGA, AIF, CIF atom sites). The MPIF JSON structure keeps data points as
+lists of dicts; the *_arrays helpers give columnar float64 views for numeric
+work. Kernels are JIT-compiled with Numba when it is installed and fall back
+to NumPy otherwise.
+"""
+
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; use the NumPy fallbacks below
+    njit = None
+
+
+def _trapezoid_py(x: np.ndarray, y: np.ndarray) -> float:
+    """Trapezoidal integral of y over x (loop form, compiled by Numba)."""
+    s = 0.0
+    for i in range(1, len(x)):
+        s += 0.5 * (y[i - 1] + y[i]) * (x[i] - x[i - 1])
+    return s
+
+
+def _trapezoid_np(x: np.ndarray, y: np.ndarray) -> float:
+    """Trapezoidal integral of y over x (vectorized NumPy form)."""
+    if len(x) < 2:
+        return 0.0
+    return float(0.5 * np.sum((y[1:] + y[:-1]) * np.diff(x)))
+
+
+_trapezoid = njit(cache=True, fastmath=True)(_trapezoid_py) if njit is not None else _trapezoid_np
+
+
+def _point_arrays(points: List[Dict[str, Any]], keys: Tuple[str, ...]) -> Tuple[np.ndarray, ...]:
+    """Transpose a list of point dicts into one contiguous float64 array per key."""
+    n = len(points)
+    return tuple(np.fromiter((p[k] for p in points), dtype=np.float64, count=n) for k in keys)
+
+
+def tga_arrays(tga: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray]:
+    """Return (temperature, weightPercent) float64 arrays from a characterization['tga'] dict."""
+    temperature, weight = _point_arrays(tga.get('data', []), ('temperature', 'weightPercent'))
+    return temperature, weight
+
+
+def pxrd_arrays(pxrd: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray]:
+    """Return (twoTheta, intensity) float64 arrays from a characterization['pxrd'] dict."""
+    two_theta, intensity = _point_arrays(pxrd.get('data', []), ('twoTheta', 'intensity'))
+    return two_theta, intensity
+
+
+def isotherm_arrays(aif: Dict[str, Any], branch: str = 'adsorption') -> Tuple[np.ndarray, np.ndarray]:
+    """Return (pressure, loading) float64 arrays for the 'adsorption' or 'desorption' branch of a parsed AIF dict."""
+    pressure, loading = _point_arrays(aif.get(f'{branch}Data', []), ('pressure', 'loading'))
+    return pressure, loading
+
+
+def integrate_tga(temperature, weight_percent) -> float:
+    """
+    Integrate a TGA weight-loss curve over temperature (trapezoidal rule).
+
+    Args:
+        temperature: Temperatures in degrees Celsius (list or array)
+        weight_percent: Weight percentages at each temperature (list or array)
+
+    Returns:
+        float: Area under the weight-percent curve in %·°C
+
+    Raises:
+        ValueError: If the two inputs differ in shape
+
+    Example:
+        >>> temp, wpct = tga_arrays(data['characterization']['tga'])
+        >>> area = integrate_tga(temp, wpct)
+    """
+    x = np.ascontiguousarray(temperature, dtype=np.float64)
+    y = np.ascontiguousarray(weight_percent, dtype=np.float64)
+    if x.shape != y.shape:
+        raise ValueError(f"temperature and weight_percent shapes differ: {x.shape} vs {y.shape}")
+    return float(_trapezoid(x, y))
+
+
+def aif_from_arrays(pressures, loadings, p0=None) -> np.recarray:
+    """
+    Pack isotherm columns into a contiguous record array.
+
+    The result can be passed as aif_data to create_mpif_json() or
+    load_characterization_data().
+
+    Example:
+        >>> iso = aif_from_arrays(pressures, loadings)
+        >>> data = create_mpif_json(aif_data=iso, aif_properties={...})
+    """
+    arrays = [np.ascontiguousarray(pressures, np.float64), np.ascontiguousarray(loadings, np.float64)]
+    names = ['pressure', 'loading']
+    if p0 is not None:
+        arrays.append(np.ascontiguousarray(p0, np.float64))
+        names.append('p0')
+    return np.rec.fromarrays(arrays, formats=[np.float64] * len(arrays), names=names)
+
+
+_ATOM_SITE_NUMERIC = ('_atom_site_fract_x', '_atom_site_fract_y', '_atom_site_fract_z', '_atom_site_occupancy')
+# CIF placeholders for unknown (?) and inapplicable (.) values
+_CIF_MISSING = frozenset({'?', '.'})
+
+
+def _cif_number_text(value: str) -> str:
+    """Strip a CIF standard uncertainty, e.g. 0.1234(5), and map ? and . to nan."""
+    return 'nan' if value in _CIF_MISSING else value.split('(', 1)[0]
+
+
+def cif_atom_site_arrays(cif: Dict[str, Any], dtype=np.float64) -> Dict[str, np.ndarray]:
+    """
+    Extract the numeric atom-site columns of a parsed CIF dict as arrays.
+
+    The CIF dict keeps values as strings so MPIF output round-trips exactly;
+    this converts the fractional coordinates and occupancies once for numeric work.
+
+    Args:
+        cif: productInfo['cif'] dict with 'loops' (headers + string rows)
+        dtype: NumPy dtype of the returned arrays (default: float64)
+
+    Returns:
+        dict: Header name -> 1-D array, for each of _atom_site_fract_x/y/z and
+              _atom_site_occupancy present in the atom-site loop; unknown (?)
+              and inapplicable (.) values are NaN
+    """
+    for loop in cif.get('loops', []):
+        headers = loop.get('headers', [])
+        cols = [(h, headers.index(h)) for h in _ATOM_SITE_NUMERIC if h in headers]
+        if not cols:
+            continue
+        rows = loop.get('data', [])
+        return {
+            h: np.array([_cif_number_text(row[j]) for row in rows], dtype=dtype)
+            for h, j in cols
+        }
+    return {}
@@ -6,12 +6,261 @@ The MPIF format is based on the CIF (Crystallographic Information File) format w
 for material synthesis and characterization data.
 """
 
+import codecs
+import functools
+import hashlib
+import io
+import itertools
 import json
+import math
+import os
 import re
-from typing import Dict, Any, List, Optional, Union
+import sys
+import threading
+from collections import OrderedDict
+from typing import (
+    Callable, Dict, Any, Final, FrozenSet, Iterable, Iterator, List, Literal, Optional, Tuple,
+    Union, overload,
+)
 
 
-def json_to_mpif(json_data: Union[str, Dict[str, Any]]) -> str:
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None  # type: ignore[assignment]
+
+
+# Synthesis detail loops emitted by json_to_mpif, in MPIF order:
+# (synthesisDetails key, loop type, ((column tag, JSON field, default), ...))
+_LoopColumns = Tuple[Tuple[str, str, str], ...]
+_LOOP_SPECS: Final[Tuple[Tuple[str, str, _LoopColumns], ...]] = (
+    ('substrates', 'substrate', (
+        ('_mpif_substrate_id', 'id', ''),
+        ('_mpif_substrate_name', 'name', ''),
+        ('_mpif_substrate_molarity', 'molarity', ''),
+        ('_mpif_substrate_molarity_unit', 'molarityUnit', ''),
+        ('_mpif_substrate_amount', 'amount', ''),
+        ('_mpif_substrate_amount_unit', 'amountUnit', ''),
+        ('_mpif_substrate_supplier', 'supplier', ''),
+        ('_mpif_substrate_purity_percent', 'purity', ''),
+        ('_mpif_substrate_cas', 'casNumber', ''),
+        ('_mpif_substrate_smiles', 'smiles', '?'),
+    )),
+    ('solvents', 'solvent', (
+        ('_mpif_solvent_id', 'id', ''),
+        ('_mpif_solvent_name', 'name', ''),
+        ('_mpif_solvent_molarity', 'molarity', ''),
+        ('_mpif_solvent_molarity_unit', 'molarityUnit', ''),
+        ('_mpif_solvent_amount', 'amount', ''),
+        ('_mpif_solvent_amount_unit', 'amountUnit', ''),
+        ('_mpif_solvent_supplier', 'supplier', ''),
+        ('_mpif_solvent_purity_percent', 'purity', ''),
+        ('_mpif_solvent_cas', 'casNumber', ''),
+        ('_mpif_solvent_smiles', 'smiles', '?'),
+    )),
+    ('vessels', 'vessel', (
+        ('_mpif_vessel_id', 'id', ''),
+        ('_mpif_vessel_volume', 'volume', ''),
+        ('_mpif_vessel_volume_unit', 'volumeUnit', ''),
+        ('_mpif_vessel_material', 'material', ''),
+        ('_mpif_vessel_type', 'type', ''),
+        ('_mpif_vessel_supplier', 'supplier', '-'),
+        ('_mpif_vessel_purpose', 'purpose', ''),
+        ('_mpif_vessel_note', 'note', '-'),
+    )),
+    ('hardware', 'hardware', (
+        ('_mpif_hardware_id', 'id', ''),
+        ('_mpif_hardware_purpose', 'purpose', ''),
+        ('_mpif_hardware_general_name', 'generalName', ''),
+        ('_mpif_hardware_product_name', 'productName', ''),
+        ('_mpif_hardware_supplier', 'supplier', ''),
+        ('_mpif_hardware_note', 'note', '-'),
+    )),
+    ('steps', 'procedure', (
+        ('_mpif_procedure_id', 'id', ''),
+        ('_mpif_procedure_type', 'type', ''),
+        ('_mpif_procedure_atmosphere', 'atmosphere', ''),
+        ('_mpif_procedure_detail', 'detail', ''),
+    )),
+)
+
+# Column layouts of the same loops as read back by mpif_to_json
+_LOOP_FIELDS: Final[Dict[str, Tuple[str, ...]]] = {
+    key: tuple(field for _, field, _ in columns) for key, _, columns in _LOOP_SPECS
+}
+_SUBSTRATE_FIELDS: Final[Tuple[str, ...]] = _LOOP_FIELDS['substrates']
+_SOLVENT_FIELDS: Final[Tuple[str, ...]] = _LOOP_FIELDS['solvents']
+_VESSEL_FIELDS: Final[Tuple[str, ...]] = _LOOP_FIELDS['vessels']
+_HARDWARE_FIELDS: Final[Tuple[str, ...]] = _LOOP_FIELDS['hardware']
+_PROCEDURE_FIELDS: Final[Tuple[str, ...]] = _LOOP_FIELDS['steps']
+
+# Type-specific synthesis parameters: (tag, field, numeric, quoted) per reaction type.
+# Numeric values are written when not None and parsed as float; text values are
+# written when non-empty, in single quotes if quoted.
+_REACTION_PARAMS: Final[Dict[str, Tuple[Tuple[str, str, bool, bool], ...]]] = {
+    'evaporation': (
+        ('_mpif_synthesis_evap_method', 'evaporationMethod', False, True),
+    ),
+    'microwave': (
+        ('_mpif_synthesis_react_microwave_power_W', 'microwavePower', True, False),
+    ),
+    'mechanochemical': (
+        ('_mpif_synthesis_react_mechanochem_method', 'mechanochemicalMethod', False, True),
+    ),
+    'electrochemical': (
+        ('_mpif_synthesis_react_electrochem_cathode', 'electrochemicalCathode', False, False),
+        ('_mpif_synthesis_react_electrochem_anode', 'electrochemicalAnode', False, False),
+        ('_mpif_synthesis_react_electrochem_reference', 'electrochemicalReference', False, False),
+        ('_mpif_synthesis_react_electrochem_voltage_V', 'electrochemicalVoltage', True, False),
+        ('_mpif_synthesis_react_electrochem_current_A', 'electrochemicalCurrent', True, False),
+    ),
+    'sonochemical': (
+        ('_mpif_synthesis_react_sonication_method', 'sonicationMethod', False, True),
+        ('_mpif_synthesis_react_sonication_power', 'sonicationPower', True, False),
+        ('_mpif_synthesis_react_sonication_power_unit', 'sonicationPowerUnit', False, True),
+    ),
+    'photochemical': (
+        ('_mpif_synthesis_react_photochemical_wavelength_nm', 'photochemicalWavelength', True, False),
+        ('_mpif_synthesis_react_photochemical_power_W', 'photochemicalPower', True, False),
+        ('_mpif_synthesis_react_photochemical_source', 'photochemicalSource', False, False),
+    ),
+}
+
+# Loop fields parsed as float, and the placeholders that mean "no value" in loop cells
+_NUMERIC_LOOP_FIELDS: Final[FrozenSet[str]] = frozenset({'molarity', 'amount', 'purity', 'volume'})
+_EMPTY_CELLS: Final[FrozenSet[str]] = frozenset({'?', '-', ''})
+
+# Column header tags that open the PXRD/TGA data loops
+_PXRD_COL_TAGS: Final[Tuple[str, ...]] = ('_pxrd_2theta', '_pxrd_intensity')
+_TGA_COL_TAGS: Final[Tuple[str, ...]] = ('_tga_temperature_celcius', '_tga_weight_percent')
+
+# `_key<whitespace>value` line; tab- (MPIF) and space-separated (CIF/AIF) forms
+_KEY_VALUE_RE: Final = re.compile(r'^(_\S+)\s+(.+?)\s*$')
+
+# Tag prefixes of MPIF key/value lines, checked with a single str.startswith call
+_KEY_PREFIXES: Final[Tuple[str, ...]] = ('_mpif_', '_pxrd_', '_tga_', '_adsorp_', '_desorp_')
+
+# Keys whose ;-delimited text block is read back by body; the PXRD/TGA data
+# blocks are parsed from the line positions, so their bodies are never joined
+_TEXT_BLOCK_KEYS: Final[FrozenSet[str]] = frozenset({
+    '_mpif_product_handling_note', '_mpif_product_cif', '_mpif_synthesis_react_note',
+    '_mpif_synthesis_safety_note', '_mpif_procedure_full', '_mpif_aif'
+})
+
+# Auto-generated ID prefix per synthesis detail list, and precomputed IDs
+# (R1..R1024, S1.., V1.., H1.., P1..)
+_ID_PREFIXES: Final[Tuple[Tuple[str, str], ...]] = (
+    ('substrates', 'R'), ('solvents', 'S'), ('vessels', 'V'), ('hardware', 'H'), ('steps', 'P')
+)
+_ID_CACHE_SIZE: Final[int] = 1024
+_ID_CACHE: Final[Dict[str, List[str]]] = {p: [f'{p}{i}' for i in range(1, _ID_CACHE_SIZE + 1)] for _, p in _ID_PREFIXES}
+
+# Enum-like string fields that repeat across records (units, suppliers, atmospheres)
+_INTERN_FIELDS: Final[FrozenSet[str]] = frozenset({
+    'molarityUnit', 'amountUnit', 'volumeUnit', 'material', 'type', 'purpose',
+    'atmosphere', 'supplier', 'handlingAtmosphere', 'reactionAtmosphere',
+    'reactionTimeUnit', 'scale', 'state', 'color'
+})
+
+# How much of a convert_to_json() string argument is inspected to tell paths from content
+_SNIFF_CHARS: Final[int] = 4096
+
+# Parsed MPIF files as JSON text, keyed by (realpath, parse_embedded_formats) and
+# kept in LRU order; the total text held is bounded rather than the file count
+_PARSE_CACHE_MAX_CHARS: Final[int] = 16 * 1024 * 1024
+_PARSE_CACHE: Final["OrderedDict[Tuple[str, bool], Tuple[Tuple[int, int], str]]"] = OrderedDict()
+_PARSE_CACHE_LOCK: Final[threading.Lock] = threading.Lock()
+_parse_cache_chars = 0
+
+# Top-level sections of the MPIF JSON structure, in output order
+_TOP_SECTIONS: Final[Tuple[str, ...]] = (
+    'metadata', 'productInfo', 'synthesisGeneral', 'synthesisDetails', 'characterization'
+)
+
+# Map of individual create_mpif_json() field names to their sections
+_FIELD_MAP: Final[Dict[str, str]] = {
+    # Metadata fields
+    'dataName': 'metadata',
+    'creationDate': 'metadata',
+    'generatorVersion': 'metadata',
+    'publicationDOI': 'metadata',
+    'procedureStatus': 'metadata',
+    'name': 'metadata',
+    'email': 'metadata',
+    'orcid': 'metadata',
+    'address': 'metadata',
+    'phone': 'metadata',
+    
+    # Product info fields
+    'type': 'productInfo',
+    'casNumber': 'productInfo',
+    'ccdcNumber': 'productInfo',
+    'commonName': 'productInfo',
+    'systematicName': 'productInfo',
+    'formula': 'productInfo',
+    'formulaWeight': 'productInfo',
+    'state': 'productInfo',
+    'color': 'productInfo',
+    'handlingAtmosphere': 'productInfo',
+    'handlingNote': 'productInfo',
+    'cif': 'productInfo',
+    
+    # Synthesis general fields
+    'performedDate': 'synthesisGeneral',
+    'labTemperature': 'synthesisGeneral',
+    'labHumidity': 'synthesisGeneral',
+    'reactionType': 'synthesisGeneral',
+    'reactionTemperature': 'synthesisGeneral',
+    'temperatureController': 'synthesisGeneral',
+    'reactionTime': 'synthesisGeneral',
+    'reactionTimeUnit': 'synthesisGeneral',
+    'reactionAtmosphere': 'synthesisGeneral',
+    'reactionContainer': 'synthesisGeneral',
+    'reactionNote': 'synthesisGeneral',
+    'productAmount': 'synthesisGeneral',
+    'productAmountUnit': 'synthesisGeneral',
+    'productYield': 'synthesisGeneral',
+    'scale': 'synthesisGeneral',
+    'safetyNote': 'synthesisGeneral',
+    'evaporationMethod': 'synthesisGeneral',
+    'microwavePower': 'synthesisGeneral',
+    'mechanochemicalMethod': 'synthesisGeneral',
+    'electrochemicalCathode': 'synthesisGeneral',
+    'electrochemicalAnode': 'synthesisGeneral',
+    'electrochemicalReference': 'synthesisGeneral',
+    'electrochemicalVoltage': 'synthesisGeneral',
+    'electrochemicalCurrent': 'synthesisGeneral',
+    'sonicationMethod': 'synthesisGeneral',
+    'sonicationPower': 'synthesisGeneral',
+    'sonicationPowerUnit': 'synthesisGeneral',
+    'photochemicalWavelength': 'synthesisGeneral',
+    'photochemicalPower': 'synthesisGeneral',
+    'photochemicalSource': 'synthesisGeneral',
+    
+    # Synthesis details fields
+    'substrates': 'synthesisDetails',
+    'solvents': 'synthesisDetails',
+    'vessels': 'synthesisDetails',
+    'hardware': 'synthesisDetails',
+    'steps': 'synthesisDetails',
+    'procedureFull': 'synthesisDetails',
+    
+    # Characterization fields
+    'pxrd': 'characterization',
+    'tga': 'characterization',
+    'adsorption': 'characterization',
+    'desorption': 'characterization',
+    'aif': 'characterization',
+}
+
+
+@overload
+def json_to_mpif(json_data: Union[str, Dict[str, Any]], return_digest: Literal[False] = ...) -> str: ...
+@overload
+def json_to_mpif(json_data: Union[str, Dict[str, Any]], return_digest: Literal[True]) -> Tuple[str, str]: ...
+@overload
+def json_to_mpif(json_data: Union[str, Dict[str, Any]], return_digest: bool) -> Union[str, Tuple[str, str]]: ...
+def json_to_mpif(json_data: Union[str, Dict[str, Any]], return_digest: bool = False) -> Union[str, Tuple[str, str]]:
     """
     Convert JSON data to MPIF format.
     
@@ -22,13 +271,78 @@ def json_to_mpif(json_data: Union[str, Dict[str, Any]]) -> str:
             - synthesisGeneral: dict with synthesis general information
             - synthesisDetails: dict with substrates, solvents, vessels, hardware, steps
             - characterization: dict with pxrd, tga, adsorption, desorption, aif data
+        return_digest: If True, also return the SHA-256 hex digest of the output so
+                       callers can check it without re-parsing (default: False)
     
     Returns:
-        str: MPIF formatted string
+        str: MPIF formatted string, or (str, digest) if return_digest=True
     
     Example:
         >>> data = {"metadata": {"dataName": "test", ...}, ...}
         >>> mpif_str = json_to_mpif(data)
+        >>> mpif_str, digest = json_to_mpif(data, return_digest=True)
+    """
+    mpif_text = "".join(json_to_mpif_iter(json_data))
+    if return_digest:
+        return mpif_text, hashlib.sha256(mpif_text.encode()).hexdigest()
+    return mpif_text
+
+
+def json_to_mpif_bytes(json_data: Union[str, Dict[str, Any]]) -> bytes:
+    """
+    Convert JSON data to UTF-8 encoded MPIF bytes.
+    
+    Each chunk is encoded as it is produced, so the full MPIF string is never
+    built before encoding. Equivalent to json_to_mpif(json_data).encode('utf-8').
+    
+    Example:
+        >>> payload = json_to_mpif_bytes(data)
+    """
+    return b"".join([chunk.encode('utf-8') for chunk in json_to_mpif_iter(json_data)])
+
+
+def write_mpif(json_data: Union[str, Dict[str, Any]], fh: Any, binary: Optional[bool] = None) -> None:
+    """
+    Write JSON data as MPIF to an open file without building the whole output.
+    
+    Args:
+        json_data: JSON string or dictionary, as accepted by json_to_mpif()
+        fh: Writable file object, in text mode or in binary mode (written as UTF-8)
+        binary: True to write UTF-8 bytes, False to write str. By default bytes
+                are written only to byte streams (io.BufferedIOBase/io.RawIOBase
+                objects, or files whose mode contains 'b'); anything else is
+                treated as a text writer
+    
+    Example:
+        >>> with open('output.mpif', 'wb') as f:
+        ...     write_mpif(data, f)
+    """
+    if binary is None:
+        mode = getattr(fh, 'mode', '')
+        binary = isinstance(fh, (io.BufferedIOBase, io.RawIOBase)) or (isinstance(mode, str) and 'b' in mode)
+    chunks = json_to_mpif_iter(json_data)
+    if binary:
+        fh.writelines(chunk.encode('utf-8') for chunk in chunks)
+    else:
+        fh.writelines(chunks)
+
+
+def json_to_mpif_iter(json_data: Union[str, Dict[str, Any]]) -> Iterator[str]:
+    """
+    Convert JSON data to MPIF format, yielding the output section by section.
+    
+    Concatenating the chunks gives exactly json_to_mpif(json_data), so large
+    records can be streamed to a file without building the whole string.
+    
+    Args:
+        json_data: JSON string or dictionary, as accepted by json_to_mpif()
+    
+    Yields:
+        str: Consecutive chunks of the MPIF text
+    
+    Example:
+        >>> with open('output.mpif', 'w') as f:
+        ...     f.writelines(json_to_mpif_iter(data))
     """
     # Parse JSON string if needed
     if isinstance(json_data, str):
@@ -36,327 +350,191 @@ def json_to_mpif(json_data: Union[str, Dict[str, Any]]) -> str:
     else:
         data = json_data
     
-    result = []
+    # Every line after the first is written with a leading "\n", so chunks
+    # concatenate into the same text as joining all lines with "\n".
+    parts: List[str] = []
+    w = parts.append
     
-    # Data block name
+    # Data block name, metadata and author details (Section 1)
     metadata = data.get('metadata', {})
-    result.append(f"data_{metadata.get('dataName', 'unknown')}")
-    
-    # Metadata
-    result.append(f"_mpif_audit_creation_date\t{metadata.get('creationDate', '')}")
-    result.append(f"_mpif_audit_generator_version\t{metadata.get('generatorVersion', '')}")
-    pub_doi = metadata.get('publicationDOI', '')
-    result.append(f"_mpif_audit_publication_doi\t'{pub_doi}'")
-    result.append(f"_mpif_audit_procedure_status\t'{metadata.get('procedureStatus', 'test')}'")
-    result.append("")
-    
-    # Section 1: Author Details
-    result.append("#Section 1: Author details")
-    result.append(f"_mpif_audit_contact_author_name\t'{metadata.get('name', '')}'")
-    result.append(f"_mpif_audit_contact_author_email\t{metadata.get('email', '')}")
-    result.append(f"_mpif_audit_contact_author_id_orcid\t{metadata.get('orcid', '')}")
-    result.append(f"_mpif_audit_contact_author_address\t'{metadata.get('address', '')}'")
-    result.append(f"_mpif_audit_contact_author_phone\t{metadata.get('phone', '?')}")
-    result.append("")
+    g = metadata.get
+    w(f"data_{g('dataName', 'unknown')}"
+      f"\n_mpif_audit_creation_date\t{g('creationDate', '')}"
+      f"\n_mpif_audit_generator_version\t{g('generatorVersion', '')}"
+      f"\n_mpif_audit_publication_doi\t'{g('publicationDOI', '')}'"
+      f"\n_mpif_audit_procedure_status\t'{g('procedureStatus', 'test')}'"
+      "\n\n#Section 1: Author details"
+      f"\n_mpif_audit_contact_author_name\t'{g('name', '')}'"
+      f"\n_mpif_audit_contact_author_email\t{g('email', '')}"
+      f"\n_mpif_audit_contact_author_id_orcid\t{g('orcid', '')}"
+      f"\n_mpif_audit_contact_author_address\t'{g('address', '')}'"
+      f"\n_mpif_audit_contact_author_phone\t{g('phone', '?')}\n")
     
     # Section 2: Product Information
     product = data.get('productInfo', {})
-    result.append("#Section 2: Product General Information")
-    result.append(f"_mpif_product_type\t'{product.get('type', '')}'")
-    result.append(f"_mpif_product_cas\t{product.get('casNumber', '?')}")
-    result.append(f"_mpif_product_ccdc\t'{product.get('ccdcNumber', '')}'")
-    result.append(f"_mpif_product_name_common\t'{product.get('commonName', '')}'")
-    result.append(f"_mpif_product_name_systematic\t'{product.get('systematicName', '')}'")
-    result.append(f"_mpif_product_formula\t'{product.get('formula', '')}'")
-    result.append(f"_mpif_product_formula_weight\t{product.get('formulaWeight', '')}")
-    result.append(f"_mpif_product_state\t'{product.get('state', '')}'")
-    result.append(f"_mpif_product_color\t'{product.get('color', '')}'")
-    result.append(f"_mpif_product_handling_atmosphere\t'{product.get('handlingAtmosphere', '')}'")
-    result.append("_mpif_product_handling_note")
-    result.append(";")
-    result.append(product.get('handlingNote', ''))
-    result.append(";")
+    g = product.get
+    w("\n#Section 2: Product General Information"
+      f"\n_mpif_product_type\t'{g('type', '')}'"
+      f"\n_mpif_product_cas\t{g('casNumber', '?')}"
+      f"\n_mpif_product_ccdc\t'{g('ccdcNumber', '')}'"
+      f"\n_mpif_product_name_common\t'{g('commonName', '')}'"
+      f"\n_mpif_product_name_systematic\t'{g('systematicName', '')}'"
+      f"\n_mpif_product_formula\t'{g('formula', '')}'"
+      f"\n_mpif_product_formula_weight\t{g('formulaWeight', '')}"
+      f"\n_mpif_product_state\t'{g('state', '')}'"
+      f"\n_mpif_product_color\t'{g('color', '')}'"
+      f"\n_mpif_product_handling_atmosphere\t'{g('handlingAtmosphere', '')}'"
+      f"\n_mpif_product_handling_note\n;\n{g('handlingNote') or ''}\n;")
     
     # Add CIF data if available
     cif_data = product.get('cif')
     if cif_data:
-        result.append("_mpif_product_cif")
-        result.append(";")
+        w("\n_mpif_product_cif\n;")
         # Check if CIF is a dictionary (structured) or string (raw)
         if isinstance(cif_data, dict):
-            result.append(_reconstruct_cif_from_dict(cif_data))
+            w("\n" + _reconstruct_cif_from_dict(cif_data))
         elif isinstance(cif_data, str):
-            result.append(cif_data)
-        result.append(";")
-    result.append("")
+            w("\n" + cif_data)
+        w("\n;")
+    w("\n")
+    yield "".join(parts)
     
     # Section 3: Synthesis General Information
     synthesis = data.get('synthesisGeneral', {})
-    result.append("#Section 3: Synthesis General Information")
-    result.append(f"_mpif_synthesis_performed_date\t{synthesis.get('performedDate', '')}")
-    result.append(f"_mpif_synthesis_lab_temperature_C\t{synthesis.get('labTemperature', '')}")
-    result.append(f"_mpif_synthesis_lab_humidity_percent\t{synthesis.get('labHumidity', '')}")
-    result.append(f"_mpif_synthesis_type\t'{synthesis.get('reactionType', '')}'")
+    g = synthesis.get
+    parts = []
+    w = parts.append
+    w("\n#Section 3: Synthesis General Information"
+      f"\n_mpif_synthesis_performed_date\t{g('performedDate', '')}"
+      f"\n_mpif_synthesis_lab_temperature_C\t{g('labTemperature', '')}"
+      f"\n_mpif_synthesis_lab_humidity_percent\t{g('labHumidity', '')}"
+      f"\n_mpif_synthesis_type\t'{g('reactionType', '')}'")
     
     # Conditional parameters based on type
-    reaction_type = synthesis.get('reactionType', '')
-    if reaction_type == 'evaporation' and synthesis.get('evaporationMethod'):
-        result.append(f"_mpif_synthesis_evap_method\t'{synthesis.get('evaporationMethod')}'")
-    if reaction_type == 'microwave' and synthesis.get('microwavePower') is not None:
-        result.append(f"_mpif_synthesis_react_microwave_power_W\t{synthesis.get('microwavePower')}")
-    if reaction_type == 'mechanochemical' and synthesis.get('mechanochemicalMethod'):
-        result.append(f"_mpif_synthesis_react_mechanochem_method\t'{synthesis.get('mechanochemicalMethod')}'")
-    if reaction_type == 'electrochemical':
-        if synthesis.get('electrochemicalCathode'):
-            result.append(f"_mpif_synthesis_react_electrochem_cathode\t{synthesis.get('electrochemicalCathode')}")
-        if synthesis.get('electrochemicalAnode'):
-            result.append(f"_mpif_synthesis_react_electrochem_anode\t{synthesis.get('electrochemicalAnode')}")
-        if synthesis.get('electrochemicalReference'):
-            result.append(f"_mpif_synthesis_react_electrochem_reference\t{synthesis.get('electrochemicalReference')}")
-        if synthesis.get('electrochemicalVoltage') is not None:
-            result.append(f"_mpif_synthesis_react_electrochem_voltage_V\t{synthesis.get('electrochemicalVoltage')}")
-        if synthesis.get('electrochemicalCurrent') is not None:
-            result.append(f"_mpif_synthesis_react_electrochem_current_A\t{synthesis.get('electrochemicalCurrent')}")
-    if reaction_type == 'sonochemical':
-        if synthesis.get('sonicationMethod'):
-            result.append(f"_mpif_synthesis_react_sonication_method\t'{synthesis.get('sonicationMethod')}'")
-        if synthesis.get('sonicationPower') is not None:
-            result.append(f"_mpif_synthesis_react_sonication_power\t{synthesis.get('sonicationPower')}")
-        if synthesis.get('sonicationPowerUnit'):
-            result.append(f"_mpif_synthesis_react_sonication_power_unit\t'{synthesis.get('sonicationPowerUnit')}'")
-    if reaction_type == 'photochemical':
-        if synthesis.get('photochemicalWavelength') is not None:
-            result.append(f"_mpif_synthesis_react_photochemical_wavelength_nm\t{synthesis.get('photochemicalWavelength')}")
-        if synthesis.get('photochemicalPower') is not None:
-            result.append(f"_mpif_synthesis_react_photochemical_power_W\t{synthesis.get('photochemicalPower')}")
-        if synthesis.get('photochemicalSource'):
-            result.append(f"_mpif_synthesis_react_photochemical_source\t{synthesis.get('photochemicalSource')}")
-    
-    result.append(f"_mpif_synthesis_react_temperature_C\t{synthesis.get('reactionTemperature', '')}")
-    result.append(f"_mpif_synthesis_react_temperature_controller\t'{synthesis.get('temperatureController', '')}'")
-    result.append(f"_mpif_synthesis_react_time\t{synthesis.get('reactionTime', '')}")
-    result.append(f"_mpif_synthesis_react_time_unit\t'{synthesis.get('reactionTimeUnit', '')}'")
-    result.append(f"_mpif_synthesis_react_atmosphere\t'{synthesis.get('reactionAtmosphere', '')}'")
-    result.append(f"_mpif_synthesis_react_container\t'{synthesis.get('reactionContainer', '')}'")
-    result.append("_mpif_synthesis_react_note")
-    result.append(";")
-    result.append(synthesis.get('reactionNote', ''))
-    result.append(";")
-    result.append(f"_mpif_synthesis_product_amount\t{synthesis.get('productAmount', '')}")
-    result.append(f"_mpif_synthesis_product_amount_unit\t'{synthesis.get('productAmountUnit', '')}'")
-    if synthesis.get('productYield'):
-        result.append(f"_mpif_synthesis_product_yield_percent\t{synthesis.get('productYield')}")
-    result.append(f"_mpif_synthesis_scale\t'{synthesis.get('scale', '')}'")
-    result.append("_mpif_synthesis_safety_note")
-    result.append(";")
-    result.append(synthesis.get('safetyNote', ''))
-    result.append(";")
-    result.append("")
+    for tag, field, numeric, quoted in _REACTION_PARAMS.get(g('reactionType', ''), ()):
+        value = g(field)
+        if value is not None if numeric else value:
+            w(f"\n{tag}\t'{value}'" if quoted else f"\n{tag}\t{value}")
+    
+    w(f"\n_mpif_synthesis_react_temperature_C\t{g('reactionTemperature', '')}"
+      f"\n_mpif_synthesis_react_temperature_controller\t'{g('temperatureController', '')}'"
+      f"\n_mpif_synthesis_react_time\t{g('reactionTime', '')}"
+      f"\n_mpif_synthesis_react_time_unit\t'{g('reactionTimeUnit', '')}'"
+      f"\n_mpif_synthesis_react_atmosphere\t'{g('reactionAtmosphere', '')}'"
+      f"\n_mpif_synthesis_react_container\t'{g('reactionContainer', '')}'"
+      f"\n_mpif_synthesis_react_note\n;\n{g('reactionNote') or ''}\n;"
+      f"\n_mpif_synthesis_product_amount\t{g('productAmount', '')}"
+      f"\n_mpif_synthesis_product_amount_unit\t'{g('productAmountUnit', '')}'")
+    if g('productYield'):
+        w(f"\n_mpif_synthesis_product_yield_percent\t{g('productYield')}")
+    w(f"\n_mpif_synthesis_scale\t'{g('scale', '')}'"
+      f"\n_mpif_synthesis_safety_note\n;\n{g('safetyNote') or ''}\n;\n")
+    yield "".join(parts)
     
     # Section 4: Synthesis Details
     details = data.get('synthesisDetails', {})
-    result.append("#Section 4: Synthesis Procedure Details")
-    
-    # Substrates
-    substrates = details.get('substrates', [])
-    if substrates:
-        result.append(f"_mpif_substrate_number\t{len(substrates)}")
-        result.append("loop_")
-        result.append("_mpif_substrate_id")
-        result.append("_mpif_substrate_name")
-        result.append("_mpif_substrate_molarity")
-        result.append("_mpif_substrate_molarity_unit")
-        result.append("_mpif_substrate_amount")
-        result.append("_mpif_substrate_amount_unit")
-        result.append("_mpif_substrate_supplier")
-        result.append("_mpif_substrate_purity_percent")
-        result.append("_mpif_substrate_cas")
-        result.append("_mpif_substrate_smiles")
-        
-        for sub in substrates:
-            line = "\t".join([
-                str(sub.get('id', '')),
-                str(sub.get('name', '')),
-                str(sub.get('molarity', '')),
-                str(sub.get('molarityUnit', '')),
-                str(sub.get('amount', '')),
-                str(sub.get('amountUnit', '')),
-                str(sub.get('supplier', '')),
-                str(sub.get('purity', '')),
-                str(sub.get('casNumber', '')),
-                str(sub.get('smiles', '?'))
-            ])
-            result.append(line)
-        result.append("")
-    
-    # Solvents
-    solvents = details.get('solvents', [])
-    if solvents:
-        result.append(f"_mpif_solvent_number\t{len(solvents)}")
-        result.append("loop_")
-        result.append("_mpif_solvent_id")
-        result.append("_mpif_solvent_name")
-        result.append("_mpif_solvent_molarity")
-        result.append("_mpif_solvent_molarity_unit")
-        result.append("_mpif_solvent_amount")
-        result.append("_mpif_solvent_amount_unit")
-        result.append("_mpif_solvent_supplier")
-        result.append("_mpif_solvent_purity_percent")
-        result.append("_mpif_solvent_cas")
-        result.append("_mpif_solvent_smiles")
-        
-        for sol in solvents:
-            line = "\t".join([
-                str(sol.get('id', '')),
-                str(sol.get('name', '')),
-                str(sol.get('molarity', '')),
-                str(sol.get('molarityUnit', '')),
-                str(sol.get('amount', '')),
-                str(sol.get('amountUnit', '')),
-                str(sol.get('supplier', '')),
-                str(sol.get('purity', '')),
-                str(sol.get('casNumber', '')),
-                str(sol.get('smiles', '?'))
-            ])
-            result.append(line)
-        result.append("")
-    
-    # Vessels
-    vessels = details.get('vessels', [])
-    if vessels:
-        result.append(f"_mpif_vessel_number\t{len(vessels)}")
-        result.append("loop_")
-        result.append("_mpif_vessel_id")
-        result.append("_mpif_vessel_volume")
-        result.append("_mpif_vessel_volume_unit")
-        result.append("_mpif_vessel_material")
-        result.append("_mpif_vessel_type")
-        result.append("_mpif_vessel_supplier")
-        result.append("_mpif_vessel_purpose")
-        result.append("_mpif_vessel_note")
-        
-        for ves in vessels:
-            line = "\t".join([
-                str(ves.get('id', '')),
-                str(ves.get('volume', '')),
-                str(ves.get('volumeUnit', '')),
-                str(ves.get('material', '')),
-                str(ves.get('type', '')),
-                str(ves.get('supplier', '-')),
-                str(ves.get('purpose', '')),
-                str(ves.get('note', '-'))
-            ])
-            result.append(line)
-        result.append("")
-    
-    # Hardware
-    hardware = details.get('hardware', [])
-    if hardware:
-        result.append(f"_mpif_hardware_number\t{len(hardware)}")
-        result.append("loop_")
-        result.append("_mpif_hardware_id")
-        result.append("_mpif_hardware_purpose")
-        result.append("_mpif_hardware_general_name")
-        result.append("_mpif_hardware_product_name")
-        result.append("_mpif_hardware_supplier")
-        result.append("_mpif_hardware_note")
-        
-        for hw in hardware:
-            line = "\t".join([
-                str(hw.get('id', '')),
-                str(hw.get('purpose', '')),
-                str(hw.get('generalName', '')),
-                str(hw.get('productName', '')),
-                str(hw.get('supplier', '')),
-                str(hw.get('note', '-'))
-            ])
-            result.append(line)
-        result.append("")
-    
-    # Procedure Steps
-    steps = details.get('steps', [])
-    if steps:
-        result.append(f"_mpif_procedure_number\t{len(steps)}")
-        result.append("loop_")
-        result.append("_mpif_procedure_id")
-        result.append("_mpif_procedure_type")
-        result.append("_mpif_procedure_atmosphere")
-        result.append("_mpif_procedure_detail")
-        
-        for step in steps:
-            line = "\t".join([
-                str(step.get('id', '')),
-                str(step.get('type', '')),
-                str(step.get('atmosphere', '')),
-                str(step.get('detail', ''))
-            ])
-            result.append(line)
-        result.append("")
+    parts = []
+    w = parts.append
+    w("\n#Section 4: Synthesis Procedure Details")
+    
+    # Substrates, solvents, vessels, hardware and procedure steps
+    for key, loop_type, header, rows in _LOOP_EMITTERS:
+        items = details.get(key, [])
+        if items:
+            w(f"\n_mpif_{loop_type}_number\t{len(items)}\nloop_{header}{rows(items)}\n")
     
     # Procedure full
     if details.get('procedureFull'):
-        result.append("_mpif_procedure_full")
-        result.append(";")
-        result.append(details.get('procedureFull', ''))
-        result.append(";")
-        result.append("")
+        w(f"\n_mpif_procedure_full\n;\n{details['procedureFull']}\n;\n")
+    yield "".join(parts)
     
     # Characterization
     char = data.get('characterization', {})
-    if char.get('pxrd') or char.get('tga') or char.get('aif'):
-        result.append("#Characterization Information")
-        result.append("")
-        
-        # PXRD
-        if char.get('pxrd'):
-            pxrd = char['pxrd']
-            result.append("_mpif_pxrd_data")
-            result.append(";")
-            result.append(f"_mpif_pxrd_source\t'{pxrd.get('source', '')}'")
-            if pxrd.get('wavelength'):
-                result.append(f"_mpif_pxrd_lambda\t{pxrd.get('wavelength')}")
-            result.append("loop_")
-            result.append("_pxrd_2theta")
-            result.append("_pxrd_intensity")
-            for point in pxrd.get('data', []):
-                result.append(f"{point.get('twoTheta', '')}\t{point.get('intensity', '')}")
-            result.append(";")
-            result.append("")
-        
-        # TGA
-        if char.get('tga'):
-            tga = char['tga']
-            result.append("_mpif_tga_data")
-            result.append(";")
-            result.append("loop_")
-            result.append("_tga_temperature_celcius")
-            result.append("_tga_weight_percent")
-            for point in tga.get('data', []):
-                result.append(f"{point.get('temperature', '')}\t{point.get('weightPercent', '')}")
-            result.append(";")
-            result.append("")
-        
-        # AIF
-        aif_data = char.get('aif')
-        if aif_data:
-            result.append("_mpif_aif")
-            result.append(";")
-            # Check if AIF is a dictionary (structured) or string (raw)
-            if isinstance(aif_data, dict):
-                result.append(_reconstruct_aif_from_dict(aif_data))
-            elif isinstance(aif_data, str):
-                result.append(aif_data)
-            result.append(";")
-    
-    return "\n".join(result)
-
-
-def mpif_to_json(mpif_content: str, parse_embedded_formats: bool = True) -> Dict[str, Any]:
+    present = [(key, emit) for key, emit in _CHAR_EMITTERS if char.get(key)]
+    if present:
+        yield "\n#Characterization Information\n"
+        for key, emit in present:
+            yield emit(char[key])
+
+
+def _emit_pxrd(pxrd: Dict[str, Any]) -> str:
+    """Render the PXRD text block."""
+    wavelength = pxrd.get('wavelength')
+    return (f"\n_mpif_pxrd_data\n;\n_mpif_pxrd_source\t'{pxrd.get('source', '')}'"
+            + (f"\n_mpif_pxrd_lambda\t{wavelength}" if wavelength else "")
+            + "\nloop_\n_pxrd_2theta\n_pxrd_intensity"
+            + _format_points(pxrd.get('data', []), 'twoTheta', 'intensity')
+            + "\n;\n")
+
+
+def _emit_tga(tga: Dict[str, Any]) -> str:
+    """Render the TGA text block."""
+    return ("\n_mpif_tga_data\n;\nloop_\n_tga_temperature_celcius\n_tga_weight_percent"
+            + _format_points(tga.get('data', []), 'temperature', 'weightPercent')
+            + "\n;\n")
+
+
+def _emit_aif(aif_data: Union[str, Dict[str, Any]]) -> str:
+    """Render the AIF text block from a structured dict or a raw string."""
+    # Check if AIF is a dictionary (structured) or string (raw)
+    if isinstance(aif_data, dict):
+        body = "\n" + _reconstruct_aif_from_dict(aif_data)
+    elif isinstance(aif_data, str):
+        body = "\n" + aif_data
+    else:
+        body = ""
+    return "\n_mpif_aif\n;" + body + "\n;"
+
+
+# Characterization sections in output order, each with its block emitter
+_CHAR_EMITTERS: Final[Tuple[Tuple[str, Callable[[Any], str]], ...]] = (
+    ('pxrd', _emit_pxrd),
+    ('tga', _emit_tga),
+    ('aif', _emit_aif),
+)
+
+
+def _make_row_formatter(columns: _LoopColumns) -> Callable[[List[Dict[str, Any]]], str]:
+    """
+    Compile the row formatter of one synthesis detail loop from its _LOOP_SPECS columns.
+    
+    Each row is built by a single generated f-string (the technique namedtuple
+    uses), which is much faster than walking the columns for every cell while
+    keeping _LOOP_SPECS the only place the fields and defaults are spelled out.
+    """
+    cells = "\\t".join(f"{{c.get({field!r}, {default!r})}}" for _, field, default in columns)
+    source = f'lambda items: "".join([f"\\n{cells}" for c in items])'
+    rows: Callable[[List[Dict[str, Any]]], str] = eval(source, {})
+    return rows
+
+
+# (synthesisDetails key, loop type, precomputed header lines, row formatter) in MPIF order
+_LOOP_EMITTERS: Final[Tuple[Tuple[str, str, str, Callable[[List[Dict[str, Any]]], str]], ...]] = tuple(
+    (key, loop_type, "".join(["\n" + tag for tag, _, _ in columns]), _make_row_formatter(columns))
+    for key, loop_type, columns in _LOOP_SPECS
+)
+
+
+def _format_points(points: List[Dict[str, Any]], x_key: str, y_key: str) -> str:
+    """Format two-column data points as "\n<x>\t<y>" rows in a single join."""
+    # Points almost always carry both keys; index them directly and only pay
+    # for dict.get defaults when one is missing
+    try:
+        return "".join([f"\n{point[x_key]}\t{point[y_key]}" for point in points])
+    except KeyError:
+        return "".join([f"\n{point.get(x_key, '')}\t{point.get(y_key, '')}" for point in points])
+
+
+def mpif_to_json(mpif_content: Union[str, bytes, Iterable[str], Iterable[bytes]],
+                 parse_embedded_formats: bool = True) -> Dict[str, Any]:
     """
     Convert MPIF format to JSON-compatible dictionary.
     
     Args:
-        mpif_content: String containing MPIF formatted data
+        mpif_content: String or UTF-8 bytes containing MPIF formatted data, or an
+                      iterable of str or UTF-8 bytes lines such as a file opened
+                      in text or binary mode (read line by line, never as one
+                      string)
         parse_embedded_formats: If True, parse CIF and AIF into structured objects.
                                If False, keep them as raw strings (default: True)
     
@@ -371,23 +549,87 @@ def mpif_to_json(mpif_content: str, parse_embedded_formats: bool = True) -> Dict
     
     Example:
         >>> with open('test.mpif', 'r') as f:
-        ...     mpif_str = f.read()
+        ...     data_dict = mpif_to_json(f)
         >>> data_dict = mpif_to_json(mpif_str)
         >>> json_str = json.dumps(data_dict, indent=2)
     """
-    lines = [line.strip() for line in mpif_content.split('\n')]
+    if isinstance(mpif_content, (bytes, bytearray)):
+        mpif_content = mpif_content.decode('utf-8')
+    source = mpif_content.split('\n') if isinstance(mpif_content, str) else _decoded_lines(mpif_content)
+    return mpif_lines_to_json(source, parse_embedded_formats)
+
+
+def _decoded_lines(source: Iterable[Any]) -> Iterable[str]:
+    """Return the lines of source as str, decoding UTF-8 if it yields bytes (e.g. a file opened 'rb')."""
+    lines = iter(source)
+    first = next(lines, None)
+    if first is None:
+        return ()
+    rest = itertools.chain((first,), lines)
+    if isinstance(first, (bytes, bytearray)):
+        return codecs.iterdecode(rest, 'utf-8')
+    return rest
+
+
+def mpif_lines_to_json(lines: Iterable[str], parse_embedded_formats: bool = True) -> Dict[str, Any]:
+    """
+    Convert already-split MPIF lines to a JSON-compatible dictionary.
+    
+    This is the core of mpif_to_json(); use it directly when the lines are
+    already at hand (a list, an open file, a generator) to skip the string
+    normalization. Lines may keep their line endings, they are stripped here.
+    
+    Args:
+        lines: Iterable of MPIF lines
+        parse_embedded_formats: If True, parse CIF and AIF into structured objects.
+                               If False, keep them as raw strings (default: True)
+    
+    Returns:
+        dict: The same structure as mpif_to_json()
+    
+    Example:
+        >>> data_dict = mpif_lines_to_json(mpif_str.split('\n'))
+    """
+    lines, index, positions, blocks = _scan_lines(lines)
     
     data = {
-        'metadata': _parse_metadata(lines),
-        'productInfo': _parse_product_info(lines, parse_embedded_formats),
-        'synthesisGeneral': _parse_synthesis_general(lines),
-        'synthesisDetails': _parse_synthesis_details(lines),
-        'characterization': _parse_characterization(lines, parse_embedded_formats)
+        'metadata': _parse_metadata(lines, index),
+        'productInfo': _parse_product_info(index, blocks, parse_embedded_formats),
+        'synthesisGeneral': _parse_synthesis_general(index, blocks),
+        'synthesisDetails': _parse_synthesis_details(lines, index, positions, blocks),
+        'characterization': _parse_characterization(lines, index, positions, blocks, parse_embedded_formats)
     }
     
     return data
 
 
+def expand_embedded_formats(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Parse raw CIF/AIF strings left by mpif_to_json(..., parse_embedded_formats=False).
+    
+    Lets callers defer the embedded-format parse until the structure is actually
+    needed; already-parsed dicts are left untouched. Modifies data in place.
+    
+    Args:
+        data: Dictionary returned by mpif_to_json
+    
+    Returns:
+        dict: The same dictionary, with productInfo['cif'] and
+              characterization['aif'] parsed into structured objects
+    
+    Example:
+        >>> data = mpif_to_json(mpif_str, parse_embedded_formats=False)
+        >>> data = expand_embedded_formats(data)
+    """
+    product = data.get('productInfo') or {}
+    if isinstance(product.get('cif'), str):
+        product['cif'] = _parse_cif_to_dict(product['cif'])
+    char = data.get('characterization') or {}
+    if isinstance(char.get('aif'), str):
+        char['aif'] = _parse_aif_to_dict(char['aif'])
+    return data
+
+
 # Helper functions for parsing
 
 def _parse_cif_to_dict(cif_text: str) -> Dict[str, Any]:
@@ -400,7 +642,7 @@ def _parse_cif_to_dict(cif_text: str) -> Dict[str, Any]:
     - loops: list of loop data structures with headers and data rows
     """
     lines = [line.strip() for line in cif_text.split('\n') if line.strip()]
-    cif_data = {
+    cif_data: Dict[str, Any] = {
         'dataName': '',
         'properties': {},
         'loops': []
@@ -418,12 +660,12 @@ def _parse_cif_to_dict(cif_text: str) -> Dict[str, Any]:
         
         # Parse loop
         if line == 'loop_':
-            loop_data = {'headers': [], 'data': []}
+            loop_data: Dict[str, List[Any]] = {'headers': [], 'data': []}
             i += 1
             
-            # Read loop headers
+            # Read loop headers (interned: the same tags repeat across files)
             while i < len(lines) and lines[i].startswith('_'):
-                loop_data['headers'].append(lines[i])
+                loop_data['headers'].append(sys.intern(lines[i]))
                 i += 1
             
             # Read loop data rows
@@ -442,14 +684,12 @@ def _parse_cif_to_dict(cif_text: str) -> Dict[str, Any]:
         
         # Parse simple property (key-value pair)
         if line.startswith('_') and '\t' not in line:
-            parts = line.split(None, 1)  # Split on first whitespace
-            if len(parts) == 2:
-                key = parts[0]
-                value = parts[1]
-                cif_data['properties'][key] = value
-            elif len(parts) == 1:
+            m = _KEY_VALUE_RE.match(line)
+            if m:
+                cif_data['properties'][sys.intern(m.group(1))] = m.group(2)
+            else:
                 # Value might be on next line
-                key = parts[0]
+                key = line
                 if i + 1 < len(lines) and not lines[i + 1].startswith('_'):
                     cif_data['properties'][key] = lines[i + 1]
                     i += 1
@@ -477,7 +717,7 @@ def _parse_aif_to_dict(aif_text: str) -> Dict[str, Any]:
     - desorptionData: list of desorption measurements (if present)
     """
     lines = [line.strip() for line in aif_text.split('\n') if line.strip()]
-    aif_data = {
+    aif_data: Dict[str, Any] = {
         'dataName': '',
         'properties': {},
         'adsorptionData': [],
@@ -498,13 +738,10 @@ def _parse_aif_to_dict(aif_text: str) -> Dict[str, Any]:
         
         # Parse property (key-value pair)
         if line.startswith('_') and 'loop_' not in line and not line.startswith('_adsorp_') and not line.startswith('_desorp_'):
-            parts = line.split(None, 1)  # Split on first whitespace
-            if len(parts) == 2:
-                key = parts[0]
-                value = parts[1]
-                # Clean up key name
-                clean_key = key[1:]  # Remove leading underscore
-                aif_data['properties'][clean_key] = value
+            m = _KEY_VALUE_RE.match(line)
+            if m:
+                # Clean up key name (remove leading underscore)
+                aif_data['properties'][sys.intern(m.group(1)[1:])] = m.group(2)
             i += 1
             continue
         
@@ -515,7 +752,7 @@ def _parse_aif_to_dict(aif_text: str) -> Dict[str, Any]:
             
             # Read headers
             while i < len(lines) and lines[i].startswith('_'):
-                loop_headers.append(lines[i])
+                loop_headers.append(sys.intern(lines[i]))
                 i += 1
             
             # Determine if this is adsorption or desorption
@@ -525,24 +762,15 @@ def _parse_aif_to_dict(aif_text: str) -> Dict[str, Any]:
                 current_loop_type = 'desorption'
             
             # Read data rows
+            rows = []
             while i < len(lines) and not lines[i].startswith('_') and lines[i] != 'loop_':
-                parts = lines[i].split()
-                if len(parts) >= 2:
-                    try:
-                        data_point = {
-                            'pressure': float(parts[0]),
-                            'loading': float(parts[1])
-                        }
-                        if len(parts) >= 3:
-                            data_point['p0'] = float(parts[2])
-                        
-                        if current_loop_type == 'adsorption':
-                            aif_data['adsorptionData'].append(data_point)
-                        elif current_loop_type == 'desorption':
-                            aif_data['desorptionData'].append(data_point)
-                    except ValueError:
-                        pass
+                rows.append(lines[i])
                 i += 1
+            
+            if current_loop_type == 'adsorption':
+                aif_data['adsorptionData'].extend(_parse_isotherm_rows(rows))
+            elif current_loop_type == 'desorption':
+                aif_data['desorptionData'].extend(_parse_isotherm_rows(rows))
             continue
         
         i += 1
@@ -550,28 +778,60 @@ def _parse_aif_to_dict(aif_text: str) -> Dict[str, Any]:
     return aif_data
 
 
+def _parse_isotherm_rows(rows: List[str]) -> List[Dict[str, float]]:
+    """Parse whitespace-separated pressure, loading (, p0) rows of an AIF loop."""
+    if not rows:
+        return []
+    
+    # Fast path: parse the whole rectangular block in C; numpy is imported on
+    # first use so plain JSON <-> MPIF conversion doesn't pay for it
+    import numpy as np
+    try:
+        arr = np.loadtxt(io.StringIO('\n'.join(rows)), dtype=np.float64, comments=None, ndmin=2)
+    except ValueError:
+        arr = None
+    if arr is not None and arr.shape[1] >= 2:
+        if arr.shape[1] >= 3:
+            return [{'pressure': p, 'loading': l, 'p0': p0} for p, l, p0 in arr[:, :3].tolist()]
+        return [{'pressure': p, 'loading': l} for p, l in arr.tolist()]
+    
+    # Ragged or partly non-numeric block: parse row by row, skipping bad rows
+    points = []
+    for row in rows:
+        parts = row.split()
+        if len(parts) >= 2:
+            try:
+                data_point: Dict[str, float] = {
+                    'pressure': float(parts[0]),
+                    'loading': float(parts[1])
+                }
+                if len(parts) >= 3:
+                    data_point['p0'] = float(parts[2])
+                points.append(data_point)
+            except ValueError:
+                pass
+    return points
+
+
 def _reconstruct_cif_from_dict(cif_dict: Dict[str, Any]) -> str:
     """Reconstruct CIF text from parsed dictionary."""
     if not cif_dict:
         return ''
     
-    lines = []
+    lines: List[str] = []
     
     # Data block name
     if cif_dict.get('dataName'):
         lines.append(f"data_{cif_dict['dataName']}")
     
     # Properties
-    for key, value in cif_dict.get('properties', {}).items():
-        lines.append(f"{key}   {value}")
+    lines.extend([f"{key}   {value}" for key, value in cif_dict.get('properties', {}).items()])
     
     # Loops
     for loop in cif_dict.get('loops', []):
         lines.append('loop_')
-        for header in loop.get('headers', []):
-            lines.append(f" {header}")
-        for row in loop.get('data', []):
-            lines.append('  ' + '  '.join(str(v) for v in row))
+        lines.extend([f" {header}" for header in loop.get('headers', [])])
+        lines.extend(['  ' + '  '.join(map(str, row)) for row in loop.get('data', [])])
         lines.append('')
     
     return '\n'.join(lines)
@@ -582,7 +842,7 @@ def _reconstruct_aif_from_dict(aif_dict: Dict[str, Any]) -> str:
     if not aif_dict:
         return ''
     
-    lines = []
+    lines: List[str] = []
     
     # Data block name
     if aif_dict.get('dataName'):
@@ -590,8 +850,7 @@ def _reconstruct_aif_from_dict(aif_dict: Dict[str, Any]) -> str:
         lines.append('')
     
     # Properties
-    for key, value in aif_dict.get('properties', {}).items():
-        lines.append(f"_{key}           {value}")
+    lines.extend([f"_{key}           {value}" for key, value in aif_dict.get('properties', {}).items()])
     
     if aif_dict.get('properties'):
         lines.append('')
@@ -601,8 +860,7 @@ def _reconstruct_aif_from_dict(aif_dict: Dict[str, Any]) -> str:
         lines.append('loop_')
         lines.append('_adsorp_pressure')
         lines.append('_adsorp_loading')
-        for point in aif_dict['adsorptionData']:
-            lines.append(f"{point['pressure']}    {point['loading']}")
+        lines.extend([f"{point['pressure']}    {point['loading']}" for point in aif_dict['adsorptionData']])
         lines.append('')
     
     # Desorption data
@@ -610,53 +868,84 @@ def _reconstruct_aif_from_dict(aif_dict: Dict[str, Any]) -> str:
         lines.append('loop_')
         lines.append('_desorp_pressure')
         lines.append('_desorp_loading')
-        for point in aif_dict['desorptionData']:
-            lines.append(f"{point['pressure']}    {point['loading']}")
+        lines.extend([f"{point['pressure']}    {point['loading']}" for point in aif_dict['desorptionData']])
         lines.append('')
     
     return '\n'.join(lines)
 
 
-def _find_value(lines: List[str], key: str) -> Optional[str]:
+def _scan_lines(source: Iterable[str]) -> Tuple[List[str], Dict[str, str], Dict[str, int], Dict[str, str]]:
+    """
+    Strip MPIF lines and index them in a single pass.
+    
+    Returns (lines, index, positions, blocks): the stripped lines; every
+    `_key value` line mapped to its value; every bare tag line (loop headers,
+    block keys) mapped to its line number; and each _TEXT_BLOCK_KEYS key
+    followed by a ;-delimited text block (blank and # comment lines may come
+    in between) mapped to the block body. The first occurrence wins in all
+    three. Block bodies are not searched for block keys, so keys inside
+    embedded CIF/AIF text never open a block of their own.
+    """
+    lines: List[str] = []
+    index: Dict[str, str] = {}
+    positions: Dict[str, int] = {}
+    blocks: Dict[str, str] = {}
+    append = lines.append
+    match = _KEY_VALUE_RE.match
+    key: Optional[str] = None  # last `_key` line, if it could still name a text block
+    block_key = ''             # key naming the open block
+    start = -1                 # index of the first body line of the open block
+    
+    for raw in source:
+        line = raw.strip()
+        # Data rows and plain text, the bulk of most files, can neither be keys
+        # nor open or close a block
+        if line and line[0] not in '_;#':
+            key = None
+            append(line)
+            continue
+        if line.startswith(_KEY_PREFIXES):
+            m = match(line)
+            if m:
+                index.setdefault(m.group(1), m.group(2).strip("'"))
+            else:
+                positions.setdefault(line, len(lines))
+        if start >= 0:
+            if line == ';':
+                if len(lines) > start and block_key in _TEXT_BLOCK_KEYS:
+                    blocks.setdefault(block_key, '\n'.join(lines[start:]))
+                start = -1
+        elif key is not None and line == ';':
+            block_key = key
+            start = len(lines) + 1
+        if start >= 0:
+            key = None
+        elif line.startswith('_'):
+            key = line
+        elif line and not line.startswith('#'):
+            # Blank and comment lines may sit between a key and its block
+            key = None
+        append(line)
+    
+    # Unterminated block runs to the end of the file
+    if start >= 0 and len(lines) > start and block_key in _TEXT_BLOCK_KEYS:
+        blocks.setdefault(block_key, '\n'.join(lines[start:]))
+    return lines, index, positions, blocks
+
+
+def _find_value(index: Dict[str, str], key: str) -> Optional[str]:
     """Find value for a given key in MPIF format."""
-    for line in lines:
-        if line.startswith(key):
-            parts = line.split('\t', 1)
-            if len(parts) > 1:
-                return parts[1].strip().strip("'")
-    return None
+    return index.get(key)
 
 
-def _extract_text_block(lines: List[str], key: str) -> Optional[str]:
+def _extract_text_block(blocks: Dict[str, str], key: str) -> Optional[str]:
     """Extract text block (between semicolons) for a given key."""
-    start_idx = None
-    for i, line in enumerate(lines):
-        if line.startswith(key):
-            start_idx = i
-            break
-    
-    if start_idx is None:
-        return None
-    
-    content = []
-    in_block = False
-    
-    for i in range(start_idx + 1, len(lines)):
-        line = lines[i]
-        if line == ';':
-            if in_block:
-                break  # End of block
-            else:
-                in_block = True  # Start of block
-        elif in_block:
-            content.append(line)
-    
-    return '\n'.join(content) if content else None
+    return blocks.get(key)
 
 
-def _parse_metadata(lines: List[str]) -> Dict[str, Any]:
+def _parse_metadata(lines: List[str], index: Dict[str, str]) -> Dict[str, Any]:
     """Parse metadata section from MPIF."""
-    metadata = {}
+    metadata: Dict[str, Any] = {}
     
     # Parse data block name
     for line in lines:
@@ -664,42 +953,42 @@ def _parse_metadata(lines: List[str]) -> Dict[str, Any]:
             metadata['dataName'] = line[5:]
             break
     
-    metadata['creationDate'] = _find_value(lines, '_mpif_audit_creation_date') or ''
-    metadata['generatorVersion'] = _find_value(lines, '_mpif_audit_generator_version') or ''
-    metadata['publicationDOI'] = _find_value(lines, '_mpif_audit_publication_doi') or ''
-    metadata['procedureStatus'] = _find_value(lines, '_mpif_audit_procedure_status') or 'test'
+    metadata['creationDate'] = _find_value(index, '_mpif_audit_creation_date') or ''
+    metadata['generatorVersion'] = _find_value(index, '_mpif_audit_generator_version') or ''
+    metadata['publicationDOI'] = _find_value(index, '_mpif_audit_publication_doi') or ''
+    metadata['procedureStatus'] = _find_value(index, '_mpif_audit_procedure_status') or 'test'
     
     # Author details
-    metadata['name'] = _find_value(lines, '_mpif_audit_contact_author_name') or ''
-    metadata['email'] = _find_value(lines, '_mpif_audit_contact_author_email') or ''
-    metadata['orcid'] = _find_value(lines, '_mpif_audit_contact_author_id_orcid') or ''
-    metadata['address'] = _find_value(lines, '_mpif_audit_contact_author_address') or ''
-    metadata['phone'] = _find_value(lines, '_mpif_audit_contact_author_phone') or ''
+    metadata['name'] = _find_value(index, '_mpif_audit_contact_author_name') or ''
+    metadata['email'] = _find_value(index, '_mpif_audit_contact_author_email') or ''
+    metadata['orcid'] = _find_value(index, '_mpif_audit_contact_author_id_orcid') or ''
+    metadata['address'] = _find_value(index, '_mpif_audit_contact_author_address') or ''
+    metadata['phone'] = _find_value(index, '_mpif_audit_contact_author_phone') or ''
     
     return metadata
 
 
-def _parse_product_info(lines: List[str], parse_cif: bool = True) -> Dict[str, Any]:
+def _parse_product_info(index: Dict[str, str], blocks: Dict[str, str], parse_cif: bool = True) -> Dict[str, Any]:
     """Parse product information from MPIF."""
-    product = {}
+    product: Dict[str, Any] = {}
     
-    product['type'] = _find_value(lines, '_mpif_product_type') or ''
-    product['casNumber'] = _find_value(lines, '_mpif_product_cas')
-    product['ccdcNumber'] = _find_value(lines, '_mpif_product_ccdc')
-    product['commonName'] = _find_value(lines, '_mpif_product_name_common') or ''
-    product['systematicName'] = _find_value(lines, '_mpif_product_name_systematic')
-    product['formula'] = _find_value(lines, '_mpif_product_formula')
+    product['type'] = _find_value(index, '_mpif_product_type') or ''
+    product['casNumber'] = _find_value(index, '_mpif_product_cas')
+    product['ccdcNumber'] = _find_value(index, '_mpif_product_ccdc')
+    product['commonName'] = _find_value(index, '_mpif_product_name_common') or ''
+    product['systematicName'] = _find_value(index, '_mpif_product_name_systematic')
+    product['formula'] = _find_value(index, '_mpif_product_formula')
     
-    fw_str = _find_value(lines, '_mpif_product_formula_weight')
-    product['formulaWeight'] = float(fw_str) if fw_str and fw_str != '' else None
+    fw_str = _find_value(index, '_mpif_product_formula_weight')
+    product['formulaWeight'] = _maybe_float(fw_str)
     
-    product['state'] = _find_value(lines, '_mpif_product_state') or ''
-    product['color'] = _find_value(lines, '_mpif_product_color') or ''
-    product['handlingAtmosphere'] = _find_value(lines, '_mpif_product_handling_atmosphere') or ''
-    product['handlingNote'] = _extract_text_block(lines, '_mpif_product_handling_note')
+    product['state'] = _find_value(index, '_mpif_product_state') or ''
+    product['color'] = _find_value(index, '_mpif_product_color') or ''
+    product['handlingAtmosphere'] = _find_value(index, '_mpif_product_handling_atmosphere') or ''
+    product['handlingNote'] = _extract_text_block(blocks, '_mpif_product_handling_note')
     
     # Handle CIF data
-    cif_text = _extract_text_block(lines, '_mpif_product_cif')
+    cif_text = _extract_text_block(blocks, '_mpif_product_cif')
     if cif_text:
         if parse_cif:
             product['cif'] = _parse_cif_to_dict(cif_text)
@@ -709,260 +998,157 @@ def _parse_product_info(lines: List[str], parse_cif: bool = True) -> Dict[str, A
     return product
 
 
-def _parse_synthesis_general(lines: List[str]) -> Dict[str, Any]:
+def _parse_synthesis_general(index: Dict[str, str], blocks: Dict[str, str]) -> Dict[str, Any]:
     """Parse synthesis general information from MPIF."""
-    synthesis = {}
+    synthesis: Dict[str, Any] = {}
     
-    synthesis['performedDate'] = _find_value(lines, '_mpif_synthesis_performed_date') or ''
+    synthesis['performedDate'] = _find_value(index, '_mpif_synthesis_performed_date') or ''
     
-    lab_temp = _find_value(lines, '_mpif_synthesis_lab_temperature_C')
-    synthesis['labTemperature'] = float(lab_temp) if lab_temp else None
+    lab_temp = _find_value(index, '_mpif_synthesis_lab_temperature_C')
+    synthesis['labTemperature'] = _maybe_float(lab_temp)
     
-    lab_hum = _find_value(lines, '_mpif_synthesis_lab_humidity_percent')
-    synthesis['labHumidity'] = float(lab_hum) if lab_hum else None
+    lab_hum = _find_value(index, '_mpif_synthesis_lab_humidity_percent')
+    synthesis['labHumidity'] = _maybe_float(lab_hum)
     
-    synthesis['reactionType'] = _find_value(lines, '_mpif_synthesis_type') or ''
+    synthesis['reactionType'] = _find_value(index, '_mpif_synthesis_type') or ''
     
     # Conditional parameters based on type
-    reaction_type = synthesis['reactionType']
-    if reaction_type == 'evaporation':
-        synthesis['evaporationMethod'] = _find_value(lines, '_mpif_synthesis_evap_method')
-    if reaction_type == 'microwave':
-        mw_power = _find_value(lines, '_mpif_synthesis_react_microwave_power_W')
-        synthesis['microwavePower'] = float(mw_power) if mw_power else None
-    if reaction_type == 'mechanochemical':
-        synthesis['mechanochemicalMethod'] = _find_value(lines, '_mpif_synthesis_react_mechanochem_method')
-    if reaction_type == 'electrochemical':
-        synthesis['electrochemicalCathode'] = _find_value(lines, '_mpif_synthesis_react_electrochem_cathode')
-        synthesis['electrochemicalAnode'] = _find_value(lines, '_mpif_synthesis_react_electrochem_anode')
-        synthesis['electrochemicalReference'] = _find_value(lines, '_mpif_synthesis_react_electrochem_reference')
-        voltage = _find_value(lines, '_mpif_synthesis_react_electrochem_voltage_V')
-        synthesis['electrochemicalVoltage'] = float(voltage) if voltage else None
-        current = _find_value(lines, '_mpif_synthesis_react_electrochem_current_A')
-        synthesis['electrochemicalCurrent'] = float(current) if current else None
-    if reaction_type == 'sonochemical':
-        synthesis['sonicationMethod'] = _find_value(lines, '_mpif_synthesis_react_sonication_method')
-        son_power = _find_value(lines, '_mpif_synthesis_react_sonication_power')
-        synthesis['sonicationPower'] = float(son_power) if son_power else None
-        synthesis['sonicationPowerUnit'] = _find_value(lines, '_mpif_synthesis_react_sonication_power_unit')
-    if reaction_type == 'photochemical':
-        wavelength = _find_value(lines, '_mpif_synthesis_react_photochemical_wavelength_nm')
-        synthesis['photochemicalWavelength'] = float(wavelength) if wavelength else None
-        power = _find_value(lines, '_mpif_synthesis_react_photochemical_power_W')
-        synthesis['photochemicalPower'] = float(power) if power else None
-        synthesis['photochemicalSource'] = _find_value(lines, '_mpif_synthesis_react_photochemical_source')
-    
-    react_temp = _find_value(lines, '_mpif_synthesis_react_temperature_C')
-    synthesis['reactionTemperature'] = float(react_temp) if react_temp else None
-    
-    synthesis['temperatureController'] = _find_value(lines, '_mpif_synthesis_react_temperature_controller') or ''
-    
-    react_time = _find_value(lines, '_mpif_synthesis_react_time')
-    synthesis['reactionTime'] = float(react_time) if react_time else None
-    
-    synthesis['reactionTimeUnit'] = _find_value(lines, '_mpif_synthesis_react_time_unit') or ''
-    synthesis['reactionAtmosphere'] = _find_value(lines, '_mpif_synthesis_react_atmosphere') or ''
-    synthesis['reactionContainer'] = _find_value(lines, '_mpif_synthesis_react_container') or ''
-    synthesis['reactionNote'] = _extract_text_block(lines, '_mpif_synthesis_react_note')
-    
-    prod_amount = _find_value(lines, '_mpif_synthesis_product_amount')
-    synthesis['productAmount'] = float(prod_amount) if prod_amount else None
-    
-    synthesis['productAmountUnit'] = _find_value(lines, '_mpif_synthesis_product_amount_unit') or ''
-    
-    prod_yield = _find_value(lines, '_mpif_synthesis_product_yield_percent')
-    synthesis['productYield'] = float(prod_yield) if prod_yield else None
-    
-    synthesis['scale'] = _find_value(lines, '_mpif_synthesis_scale') or ''
-    synthesis['safetyNote'] = _extract_text_block(lines, '_mpif_synthesis_safety_note')
+    for tag, field, numeric, _ in _REACTION_PARAMS.get(synthesis['reactionType'], ()):
+        value = _find_value(index, tag)
+        synthesis[field] = _maybe_float(value) if numeric else value
+    
+    react_temp = _find_value(index, '_mpif_synthesis_react_temperature_C')
+    synthesis['reactionTemperature'] = _maybe_float(react_temp)
+    
+    synthesis['temperatureController'] = _find_value(index, '_mpif_synthesis_react_temperature_controller') or ''
+    
+    react_time = _find_value(index, '_mpif_synthesis_react_time')
+    synthesis['reactionTime'] = _maybe_float(react_time)
+    
+    synthesis['reactionTimeUnit'] = _find_value(index, '_mpif_synthesis_react_time_unit') or ''
+    synthesis['reactionAtmosphere'] = _find_value(index, '_mpif_synthesis_react_atmosphere') or ''
+    synthesis['reactionContainer'] = _find_value(index, '_mpif_synthesis_react_container') or ''
+    synthesis['reactionNote'] = _extract_text_block(blocks, '_mpif_synthesis_react_note')
+    
+    prod_amount = _find_value(index, '_mpif_synthesis_product_amount')
+    synthesis['productAmount'] = _maybe_float(prod_amount)
+    
+    synthesis['productAmountUnit'] = _find_value(index, '_mpif_synthesis_product_amount_unit') or ''
+    
+    prod_yield = _find_value(index, '_mpif_synthesis_product_yield_percent')
+    synthesis['productYield'] = _maybe_float(prod_yield)
+    
+    synthesis['scale'] = _find_value(index, '_mpif_synthesis_scale') or ''
+    synthesis['safetyNote'] = _extract_text_block(blocks, '_mpif_synthesis_safety_note')
     
     return synthesis
 
 
-def _parse_loop_data(lines: List[str], loop_type: str, fields: List[str]) -> List[Dict[str, Any]]:
+def _parse_loop_data(lines: List[str], index: Dict[str, str], positions: Dict[str, int],
+                     loop_type: str, fields: Tuple[str, ...]) -> List[Dict[str, Any]]:
     """Parse loop data from MPIF format."""
     # Find the count
     count_key = f'_mpif_{loop_type}_number'
-    count_str = _find_value(lines, count_key)
+    count_str = _find_value(index, count_key)
     if not count_str:
         return []
     
     count = int(count_str)
-    if count == 0:
+    if count <= 0:
         return []
     
     # Find the start of the loop
-    loop_start = None
-    for i, line in enumerate(lines):
-        if line.startswith(f'_mpif_{loop_type}_id'):
-            loop_start = i
-            break
-    
+    loop_start = positions.get(f'_mpif_{loop_type}_id')
     if loop_start is None:
         return []
     
     # Skip header lines to get to data
+    n = len(lines)
     data_start = loop_start
-    for i in range(loop_start, len(lines)):
-        line = lines[i]
-        if not line.startswith('_mpif_') and not line.startswith('loop_') and line.strip() != '':
-            data_start = i
-            break
+    while data_start < n and (lines[data_start].startswith(('_mpif_', 'loop_')) or lines[data_start] == ''):
+        data_start += 1
     
-    # Parse data rows
-    results = []
-    items_parsed = 0
+    # Collect data rows, stopping as soon as count rows are in
+    rows: List[List[str]] = []
+    n_fields = len(fields)
     
-    for i in range(data_start, len(lines)):
-        if items_parsed >= count:
-            break
-        
+    for i in range(data_start, n):
         line = lines[i]
         
         # Stop if we hit a new section
-        if line.startswith('_mpif_') or line.startswith('#') or line == '':
+        if line.startswith(('_mpif_', '#')) or line == '':
             break
         
         values = line.split('\t')
-        if len(values) < len(fields):
-            continue
-        
-        item = {}
-        for j, field in enumerate(fields):
-            value = values[j].strip() if j < len(values) else ''
-            
-            # Type conversion
-            if field in ['molarity', 'amount', 'purity', 'volume']:
-                try:
-                    item[field] = float(value) if value and value not in ['?', '-', ''] else None
-                except ValueError:
-                    item[field] = None
-            else:
-                item[field] = value if value not in ['?', '-', ''] else None
-        
-        results.append(item)
-        items_parsed += 1
+        if len(values) >= n_fields:
+            rows.append(values)
+            if len(rows) == count:
+                break
+    
+    # Convert column by column, then reassemble the row dicts
+    columns: List[List[Any]] = []
+    for j, field in enumerate(fields):
+        cells = [row[j].strip() for row in rows]
+        if field in _NUMERIC_LOOP_FIELDS:
+            columns.append([_maybe_float(v) for v in cells])
+        else:
+            columns.append([None if v in _EMPTY_CELLS else v for v in cells])
     
-    return results
+    return [dict(zip(fields, values)) for values in zip(*columns)]
+
+
+def _maybe_float(value: Optional[str]) -> Optional[float]:
+    """Convert an MPIF value to float, mapping missing values, placeholders and bad numbers to None."""
+    if not value or value in _EMPTY_CELLS:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
 
 
-def _parse_synthesis_details(lines: List[str]) -> Dict[str, Any]:
+def _parse_synthesis_details(lines: List[str], index: Dict[str, str], positions: Dict[str, int],
+                             blocks: Dict[str, str]) -> Dict[str, Any]:
     """Parse synthesis details from MPIF."""
-    details = {}
-    
-    details['substrates'] = _parse_loop_data(lines, 'substrate', [
-        'id', 'name', 'molarity', 'molarityUnit', 'amount', 'amountUnit',
-        'supplier', 'purity', 'casNumber', 'smiles'
-    ])
-    
-    details['solvents'] = _parse_loop_data(lines, 'solvent', [
-        'id', 'name', 'molarity', 'molarityUnit', 'amount', 'amountUnit',
-        'supplier', 'purity', 'casNumber', 'smiles'
-    ])
-    
-    details['vessels'] = _parse_loop_data(lines, 'vessel', [
-        'id', 'volume', 'volumeUnit', 'material', 'type', 'supplier', 'purpose', 'note'
-    ])
+    details: Dict[str, Any] = {}
     
-    details['hardware'] = _parse_loop_data(lines, 'hardware', [
-        'id', 'purpose', 'generalName', 'productName', 'supplier', 'note'
-    ])
+    details['substrates'] = _parse_loop_data(lines, index, positions, 'substrate', _SUBSTRATE_FIELDS)
+    details['solvents'] = _parse_loop_data(lines, index, positions, 'solvent', _SOLVENT_FIELDS)
+    details['vessels'] = _parse_loop_data(lines, index, positions, 'vessel', _VESSEL_FIELDS)
+    details['hardware'] = _parse_loop_data(lines, index, positions, 'hardware', _HARDWARE_FIELDS)
+    details['steps'] = _parse_loop_data(lines, index, positions, 'procedure', _PROCEDURE_FIELDS)
     
-    details['steps'] = _parse_loop_data(lines, 'procedure', [
-        'id', 'type', 'atmosphere', 'detail'
-    ])
-    
-    details['procedureFull'] = _extract_text_block(lines, '_mpif_procedure_full')
+    details['procedureFull'] = _extract_text_block(blocks, '_mpif_procedure_full')
     
     return details
 
 
-def _parse_characterization(lines: List[str], parse_aif: bool = True) -> Dict[str, Any]:
+def _parse_characterization(lines: List[str], index: Dict[str, str], positions: Dict[str, int],
+                            blocks: Dict[str, str], parse_aif: bool = True) -> Dict[str, Any]:
     """Parse characterization data from MPIF."""
-    char = {}
+    char: Dict[str, Any] = {}
     
     # Parse PXRD
-    pxrd_idx = None
-    for i, line in enumerate(lines):
-        if line.startswith('_mpif_pxrd_data'):
-            pxrd_idx = i
-            break
-    
-    if pxrd_idx is not None:
-        pxrd = {'data': []}
-        in_loop_data = False
-        found_data_end = False
-        
-        for i in range(pxrd_idx + 1, len(lines)):
-            if found_data_end:
-                break
-            
-            line = lines[i]
-            
-            if line == ';' and in_loop_data:
-                found_data_end = True
-            elif '_mpif_pxrd_source' in line:
-                pxrd['source'] = line.split('\t')[1].strip().strip("'")
-            elif '_mpif_pxrd_lambda' in line:
-                pxrd['wavelength'] = float(line.split('\t')[1])
-            elif '_pxrd_2theta' in line or '_pxrd_intensity' in line:
-                in_loop_data = True
-            elif in_loop_data and '\t' in line and not line.startswith('_'):
-                parts = line.split('\t')
-                if len(parts) >= 2:
-                    try:
-                        pxrd['data'].append({
-                            'twoTheta': float(parts[0]),
-                            'intensity': float(parts[1])
-                        })
-                    except ValueError:
-                        pass
-            elif line.startswith('_mpif_') and in_loop_data:
-                found_data_end = True
-        
-        if pxrd['data']:
-            char['pxrd'] = pxrd
+    points = _parse_two_column_block(lines, positions, '_mpif_pxrd_data', _PXRD_COL_TAGS,
+                                     ('twoTheta', 'intensity'))
+    if points:
+        pxrd: Dict[str, Any] = {'data': points}
+        source = _find_value(index, '_mpif_pxrd_source')
+        if source is not None:
+            pxrd['source'] = source
+        wavelength = _maybe_float(_find_value(index, '_mpif_pxrd_lambda'))
+        if wavelength is not None:
+            pxrd['wavelength'] = wavelength
+        char['pxrd'] = pxrd
     
     # Parse TGA
-    tga_idx = None
-    for i, line in enumerate(lines):
-        if line.startswith('_mpif_tga_data'):
-            tga_idx = i
-            break
-    
-    if tga_idx is not None:
-        tga = {'data': []}
-        in_loop_data = False
-        found_data_end = False
-        
-        for i in range(tga_idx + 1, len(lines)):
-            if found_data_end:
-                break
-            
-            line = lines[i]
-            
-            if line == ';' and in_loop_data:
-                found_data_end = True
-            elif '_tga_temperature_celcius' in line or '_tga_weight_percent' in line:
-                in_loop_data = True
-            elif in_loop_data and '\t' in line and not line.startswith('_'):
-                parts = line.split('\t')
-                if len(parts) >= 2:
-                    try:
-                        tga['data'].append({
-                            'temperature': float(parts[0]),
-                            'weightPercent': float(parts[1])
-                        })
-                    except ValueError:
-                        pass
-            elif line.startswith('_mpif_') and in_loop_data:
-                found_data_end = True
-        
-        if tga['data']:
-            char['tga'] = tga
+    points = _parse_two_column_block(lines, positions, '_mpif_tga_data', _TGA_COL_TAGS,
+                                     ('temperature', 'weightPercent'))
+    if points:
+        char['tga'] = {'data': points}
     
     # Parse AIF
-    aif_text = _extract_text_block(lines, '_mpif_aif')
+    aif_text = _extract_text_block(blocks, '_mpif_aif')
     if aif_text:
         if parse_aif:
             char['aif'] = _parse_aif_to_dict(aif_text)
@@ -972,7 +1158,56 @@ def _parse_characterization(lines: List[str], parse_aif: bool = True) -> Dict[st
     return char
 
 
-def create_mpif_json(**kwargs) -> Dict[str, Any]:
+def _parse_two_column_block(lines: List[str], positions: Dict[str, int], header_tag: str,
+                            col_tags: Tuple[str, ...], keys: Tuple[str, str]) -> List[Dict[str, float]]:
+    """Parse the x, y data loop of a PXRD/TGA text block opened by header_tag."""
+    start = positions.get(header_tag)
+    if start is None:
+        return []
+    
+    rows: List[str] = []
+    in_loop_data = False
+    for i in range(start + 1, len(lines)):
+        line = lines[i]
+        if line == ';' and in_loop_data:
+            break
+        elif line.startswith(col_tags):
+            in_loop_data = True
+        elif in_loop_data and '\t' in line and not line.startswith('_'):
+            rows.append(line)
+        elif line.startswith('_mpif_') and in_loop_data:
+            break
+    
+    return _parse_point_rows(rows, keys[0], keys[1])
+
+
+def _parse_point_rows(rows: List[str], x_key: str, y_key: str) -> List[Dict[str, float]]:
+    """Parse tab-separated x, y rows of a PXRD/TGA loop; extra columns are ignored."""
+    if not rows:
+        return []
+    
+    # Fast path: parse the whole rectangular block in C (numpy imported on first use)
+    import numpy as np
+    try:
+        arr = np.loadtxt(io.StringIO('\n'.join(rows)), dtype=np.float64, delimiter='\t',
+                         comments=None, ndmin=2)
+    except ValueError:
+        arr = None
+    if arr is not None:
+        return [{x_key: x, y_key: y} for x, y in arr[:, :2].tolist()]
+    
+    # Ragged or partly non-numeric block: parse row by row, skipping bad rows
+    points = []
+    for row in rows:
+        first, _, rest = row.partition('\t')
+        try:
+            points.append({x_key: float(first), y_key: float(rest.partition('\t')[0])})
+        except ValueError:
+            pass
+    return points
+
+
+def create_mpif_json(**kwargs: Any) -> Dict[str, Any]:
     """
     Create MPIF JSON structure from variable arguments.
     
@@ -985,6 +1220,8 @@ def create_mpif_json(**kwargs) -> Dict[str, Any]:
               synthesisDetails, characterization
             - Individual fields that will be organized into appropriate sections
             - File paths: mpif_file, json_file to load data from files
+            - use_cache: If False, re-parse mpif_file instead of reusing a cached
+              parse of the unchanged file (default: True)
             - Characterization data: pxrd_data, pxrd_source, pxrd_wavelength,
               tga_data, aif_data, aif_properties, cif_dict, cif_string
     
@@ -1009,187 +1246,149 @@ def create_mpif_json(**kwargs) -> Dict[str, Any]:
             commonName='New-Name'
         )
     """
-    # Initialize default structure
-    data = {
-        'metadata': {},
-        'productInfo': {},
-        'synthesisGeneral': {},
-        'synthesisDetails': {
-            'substrates': [],
-            'solvents': [],
-            'vessels': [],
-            'hardware': [],
-            'steps': [],
-        },
-        'characterization': {}
-    }
+    mpif_file = kwargs.pop('mpif_file', None)
+    json_file = kwargs.pop('json_file', None)
+    parse_embedded_formats = kwargs.pop('parse_embedded_formats', True)
+    use_cache = kwargs.pop('use_cache', True)
     
-    # Handle file loading
-    if 'mpif_file' in kwargs:
-        with open(kwargs['mpif_file'], 'r') as f:
-            data = mpif_to_json(f.read(), kwargs.get('parse_embedded_formats', True))
-        del kwargs['mpif_file']
-        if 'parse_embedded_formats' in kwargs:
-            del kwargs['parse_embedded_formats']
-    
-    if 'json_file' in kwargs:
-        import json as json_module
-        with open(kwargs['json_file'], 'r') as f:
-            loaded_data = json_module.load(f)
-            # Deep merge
-            for key in data:
-                if key in loaded_data:
-                    if isinstance(data[key], dict) and isinstance(loaded_data[key], dict):
-                        data[key].update(loaded_data[key])
-                    else:
-                        data[key] = loaded_data[key]
-        del kwargs['json_file']
-    
-    # Map of field names to their sections
-    field_map = {
-        # Metadata fields
-        'dataName': 'metadata',
-        'creationDate': 'metadata',
-        'generatorVersion': 'metadata',
-        'publicationDOI': 'metadata',
-        'procedureStatus': 'metadata',
-        'name': 'metadata',
-        'email': 'metadata',
-        'orcid': 'metadata',
-        'address': 'metadata',
-        'phone': 'metadata',
-        
-        # Product info fields
-        'type': 'productInfo',
-        'casNumber': 'productInfo',
-        'ccdcNumber': 'productInfo',
-        'commonName': 'productInfo',
-        'systematicName': 'productInfo',
-        'formula': 'productInfo',
-        'formulaWeight': 'productInfo',
-        'state': 'productInfo',
-        'color': 'productInfo',
-        'handlingAtmosphere': 'productInfo',
-        'handlingNote': 'productInfo',
-        'cif': 'productInfo',
-        
-        # Synthesis general fields
-        'performedDate': 'synthesisGeneral',
-        'labTemperature': 'synthesisGeneral',
-        'labHumidity': 'synthesisGeneral',
-        'reactionType': 'synthesisGeneral',
-        'reactionTemperature': 'synthesisGeneral',
-        'temperatureController': 'synthesisGeneral',
-        'reactionTime': 'synthesisGeneral',
-        'reactionTimeUnit': 'synthesisGeneral',
-        'reactionAtmosphere': 'synthesisGeneral',
-        'reactionContainer': 'synthesisGeneral',
-        'reactionNote': 'synthesisGeneral',
-        'productAmount': 'synthesisGeneral',
-        'productAmountUnit': 'synthesisGeneral',
-        'productYield': 'synthesisGeneral',
-        'scale': 'synthesisGeneral',
-        'safetyNote': 'synthesisGeneral',
-        'evaporationMethod': 'synthesisGeneral',
-        'microwavePower': 'synthesisGeneral',
-        'mechanochemicalMethod': 'synthesisGeneral',
-        'electrochemicalCathode': 'synthesisGeneral',
-        'electrochemicalAnode': 'synthesisGeneral',
-        'electrochemicalReference': 'synthesisGeneral',
-        'electrochemicalVoltage': 'synthesisGeneral',
-        'electrochemicalCurrent': 'synthesisGeneral',
-        'sonicationMethod': 'synthesisGeneral',
-        'sonicationPower': 'synthesisGeneral',
-        'sonicationPowerUnit': 'synthesisGeneral',
-        'photochemicalWavelength': 'synthesisGeneral',
-        'photochemicalPower': 'synthesisGeneral',
-        'photochemicalSource': 'synthesisGeneral',
-        
-        # Synthesis details fields
-        'substrates': 'synthesisDetails',
-        'solvents': 'synthesisDetails',
-        'vessels': 'synthesisDetails',
-        'hardware': 'synthesisDetails',
-        'steps': 'synthesisDetails',
-        'procedureFull': 'synthesisDetails',
-        
-        # Characterization fields
-        'pxrd': 'characterization',
-        'tga': 'characterization',
-        'adsorption': 'characterization',
-        'desorption': 'characterization',
-        'aif': 'characterization',
-    }
+    # Handle file loading, otherwise initialize default structure
+    if mpif_file:
+        data = _read_mpif_file(mpif_file, parse_embedded_formats, use_cache)
+    else:
+        data = {
+            'metadata': {},
+            'productInfo': {},
+            'synthesisGeneral': {},
+            'synthesisDetails': {
+                'substrates': [],
+                'solvents': [],
+                'vessels': [],
+                'hardware': [],
+                'steps': [],
+            },
+            'characterization': {}
+        }
+    
+    if json_file:
+        with open(json_file, 'r') as f:
+            _merge_sections(data, json.load(f))
     
+    _apply_kwargs(data, kwargs)
+    return data
+
+
+def _merge_sections(data: Dict[str, Any], loaded_data: Dict[str, Any]) -> None:
+    """Merge the sections of loaded_data into the existing sections of data in place."""
+    # Deep merge
+    for key in data:
+        if key in loaded_data:
+            if isinstance(data[key], dict) and isinstance(loaded_data[key], dict):
+                data[key].update(loaded_data[key])
+            else:
+                data[key] = loaded_data[key]
+
+
+def _apply_kwargs(data: Dict[str, Any], kwargs: Dict[str, Any]) -> None:
+    """Apply create_mpif_json() section, field and characterization kwargs to data in place."""
     # Process top-level section updates
-    for section in ['metadata', 'productInfo', 'synthesisGeneral', 'synthesisDetails', 'characterization']:
+    for section in _TOP_SECTIONS:
         if section in kwargs:
-            if isinstance(kwargs[section], dict):
+            if isinstance(kwargs[section], dict) and isinstance(data.get(section), dict):
                 data[section].update(kwargs[section])
             else:
                 data[section] = kwargs[section]
     
     # Process individual field updates
     for key, value in kwargs.items():
-        if key in field_map:
-            section = field_map[key]
-            data[section][key] = value
-        elif key not in ['metadata', 'productInfo', 'synthesisGeneral', 'synthesisDetails', 'characterization']:
-            # Unknown field - try to place it intelligently or warn
-            pass
+        target = _FIELD_MAP.get(key)
+        if target is not None:
+            data.setdefault(target, {})[key] = value
     
     # Auto-generate IDs for arrays if not provided
-    if data['synthesisDetails']['substrates']:
-        for i, substrate in enumerate(data['synthesisDetails']['substrates']):
-            if 'id' not in substrate or not substrate['id']:
-                substrate['id'] = f'R{i+1}'
-    
-    if data['synthesisDetails']['solvents']:
-        for i, solvent in enumerate(data['synthesisDetails']['solvents']):
-            if 'id' not in solvent or not solvent['id']:
-                solvent['id'] = f'S{i+1}'
-    
-    if data['synthesisDetails']['vessels']:
-        for i, vessel in enumerate(data['synthesisDetails']['vessels']):
-            if 'id' not in vessel or not vessel['id']:
-                vessel['id'] = f'V{i+1}'
-    
-    if data['synthesisDetails']['hardware']:
-        for i, hw in enumerate(data['synthesisDetails']['hardware']):
-            if 'id' not in hw or not hw['id']:
-                hw['id'] = f'H{i+1}'
-    
-    if data['synthesisDetails']['steps']:
-        for i, step in enumerate(data['synthesisDetails']['steps']):
-            if 'id' not in step or not step['id']:
-                step['id'] = f'P{i+1}'
+    details = data.get('synthesisDetails') or {}
+    
+    for key, prefix in _ID_PREFIXES:
+        items = details.get(key)
+        if not items or all(item.get('id') for item in items):
+            continue
+        ids = _ID_CACHE[prefix]
+        for i, item in enumerate(items):
+            if not item.get('id'):
+                item['id'] = ids[i] if i < _ID_CACHE_SIZE else f'{prefix}{i + 1}'
+    
+    # Share one string object per repeated enum-like value
+    for key in ('substrates', 'solvents', 'vessels', 'hardware', 'steps'):
+        for item in details.get(key) or ():
+            for field in _INTERN_FIELDS.intersection(item):
+                value = item[field]
+                if isinstance(value, str):
+                    item[field] = sys.intern(value)
     
     # Handle characterization data if provided
-    char_keys = ['pxrd_data', 'pxrd_df', 'pxrd_source', 'pxrd_wavelength',
+    char_keys = ('pxrd_data', 'pxrd_df', 'pxrd_source', 'pxrd_wavelength',
                  'tga_data', 'tga_df',
-                 'aif_data', 'aif_df', 'aif_properties']
+                 'aif_data', 'aif_df', 'aif_properties')
     
-    char_kwargs = {k: v for k, v in kwargs.items() if k in char_keys}
+    # Probe the handful of known keys rather than scanning every kwarg
+    char_kwargs = {k: kwargs[k] for k in char_keys if k in kwargs}
     
     if char_kwargs:
         # Load characterization data (PXRD, TGA, AIF)
         char_data = load_characterization_data(**char_kwargs)
         # Merge with existing characterization data
-        if not data['characterization']:
+        if not data.get('characterization'):
             data['characterization'] = char_data
         else:
             data['characterization'].update(char_data)
     
     # Handle CIF data separately (goes to productInfo, not characterization)
     if 'cif_dict' in kwargs:
-        data['productInfo']['cif'] = kwargs['cif_dict']
+        data.setdefault('productInfo', {})['cif'] = kwargs['cif_dict']
     elif 'cif_string' in kwargs:
-        data['productInfo']['cif'] = kwargs['cif_string']
-    
+        data.setdefault('productInfo', {})['cif'] = kwargs['cif_string']
+
+
+def _read_mpif_file(path: str, parse_embedded_formats: bool = True, use_cache: bool = True) -> Dict[str, Any]:
+    """Parse an MPIF file, reusing the previous parse while its mtime and size are unchanged."""
+    path = os.path.realpath(path)
+    if not use_cache:
+        with open(path, 'r') as f:
+            return mpif_lines_to_json(f, parse_embedded_formats)
+    
+    st = os.stat(path)
+    key = (path, parse_embedded_formats)
+    stamp = (st.st_mtime_ns, st.st_size)
+    with _PARSE_CACHE_LOCK:
+        entry = _PARSE_CACHE.get(key)
+        if entry is not None and entry[0] == stamp:
+            _PARSE_CACHE.move_to_end(key)
+            # The cache holds JSON text, so every caller gets a fresh, independent dict
+            return json.loads(entry[1])
+    
+    with open(path, 'r') as f:
+        data = mpif_lines_to_json(f, parse_embedded_formats)
+    _store_parse(key, stamp, json.dumps(data))
     return data
 
 
-def convert_to_json(*args, **kwargs) -> Union[str, Dict[str, Any]]:
+def _store_parse(key: Tuple[str, bool], stamp: Tuple[int, int], text: str) -> None:
+    """Cache one file's JSON text, evicting least recently used entries to stay within budget."""
+    global _parse_cache_chars
+    if len(text) > _PARSE_CACHE_MAX_CHARS:
+        return
+    with _PARSE_CACHE_LOCK:
+        # A changed file replaces its stale entry instead of taking a new slot
+        old = _PARSE_CACHE.pop(key, None)
+        if old is not None:
+            _parse_cache_chars -= len(old[1])
+        _PARSE_CACHE[key] = (stamp, text)
+        _parse_cache_chars += len(text)
+        while _parse_cache_chars > _PARSE_CACHE_MAX_CHARS:
+            _, (_, evicted) = _PARSE_CACHE.popitem(last=False)
+            _parse_cache_chars -= len(evicted)
+
+
+def convert_to_json(*args: Any, **kwargs: Any) -> Union[str, Dict[str, Any]]:
     """
     Flexible function to convert various inputs to MPIF JSON.
     
@@ -1204,7 +1403,8 @@ def convert_to_json(*args, **kwargs) -> Union[str, Dict[str, Any]]:
             - If string starting with 'data_' or containing MPIF tags: treated as MPIF content
             - If string ending with '.mpif': treated as file path
             - If dict: treated as base data to update
-        **kwargs: Keyword arguments passed to create_mpif_json() or parsing options
+        **kwargs: Keyword arguments passed to create_mpif_json() or parsing options;
+                  use_cache=False re-parses file paths instead of reusing a cached parse
     
     Returns:
         dict or str: MPIF data structure (dict) or JSON string if return_string=True
@@ -1232,31 +1432,31 @@ def convert_to_json(*args, **kwargs) -> Union[str, Dict[str, Any]]:
         # Return as JSON string
         json_str = convert_to_json('test.mpif', return_string=True)
     """
-    import os
-    
     return_string = kwargs.pop('return_string', False)
     parse_embedded_formats = kwargs.pop('parse_embedded_formats', True)
+    use_cache = kwargs.pop('use_cache', True)
     
-    data = None
+    data: Optional[Dict[str, Any]] = None
     
     # Process positional arguments
     if len(args) == 1:
         arg = args[0]
         
         if isinstance(arg, str):
+            # Only short single-line strings can be paths; never stat MPIF content
+            maybe_path = len(arg) < _SNIFF_CHARS and '\n' not in arg
+            # The MPIF header tags appear near the top, so only sniff the head
+            head = arg[:_SNIFF_CHARS]
+            
             # Check if it's a file path
-            if arg.endswith('.mpif') and os.path.isfile(arg):
-                with open(arg, 'r') as f:
-                    content = f.read()
-                data = mpif_to_json(content, parse_embedded_formats)
+            if maybe_path and arg.endswith('.mpif') and os.path.isfile(arg):
+                data = _read_mpif_file(arg, parse_embedded_formats, use_cache)
             # Check if it's MPIF content
-            elif 'data_' in arg or '_mpif_' in arg:
+            elif 'data_' in head or '_mpif_' in head:
                 data = mpif_to_json(arg, parse_embedded_formats)
             # Otherwise treat as file path
-            elif os.path.isfile(arg):
-                with open(arg, 'r') as f:
-                    content = f.read()
-                data = mpif_to_json(content, parse_embedded_formats)
+            elif maybe_path and os.path.isfile(arg):
+                data = _read_mpif_file(arg, parse_embedded_formats, use_cache)
             else:
                 raise ValueError(f"Invalid input: {arg}")
         
@@ -1265,23 +1465,87 @@ def convert_to_json(*args, **kwargs) -> Union[str, Dict[str, Any]]:
     
     # If no positional args or we need to update, use create_mpif_json
     if data is None:
-        data = create_mpif_json(**kwargs)
+        data = create_mpif_json(use_cache=use_cache, **kwargs)
     elif kwargs:
-        # Update existing data with kwargs
-        update_data = create_mpif_json(**kwargs)
-        for section in data:
-            if section in update_data and isinstance(data[section], dict):
-                data[section].update(update_data[section])
+        # Update existing data with kwargs, file overrides first as in create_mpif_json()
+        mpif_file = kwargs.pop('mpif_file', None)
+        json_file = kwargs.pop('json_file', None)
+        if mpif_file:
+            _merge_sections(data, _read_mpif_file(mpif_file, parse_embedded_formats, use_cache))
+        if json_file:
+            with open(json_file, 'r') as f:
+                _merge_sections(data, json.load(f))
+        _apply_kwargs(data, kwargs)
     
     # Return as JSON string if requested
     if return_string:
-        import json as json_module
-        return json_module.dumps(data, indent=2)
+        return _dumps_indented(data)
     
     return data
 
 
-def load_characterization_data(**kwargs) -> Dict[str, Any]:
+def convert_batch(paths: Iterable[str], *, workers: Optional[int] = None,
+                  **kwargs: Any) -> List[Union[str, Dict[str, Any]]]:
+    """
+    Convert many MPIF files to JSON in parallel worker processes.
+    
+    Each file is parsed independently with convert_to_json(path, **kwargs), so
+    a batch spreads across CPU cores. Results are returned in input order.
+    
+    Args:
+        paths: MPIF file paths
+        workers: Number of worker processes (default: os.cpu_count()); 1 converts
+                 in the calling process
+        **kwargs: Passed to convert_to_json() for every file (e.g.
+                  parse_embedded_formats, return_string, field overrides);
+                  values must be picklable
+    
+    Returns:
+        list: One convert_to_json() result per path
+    
+    Example:
+        >>> if __name__ == '__main__':  # required where workers are spawned
+        ...     results = convert_batch(glob.glob('corpus/*.mpif'), workers=8)
+    """
+    paths = list(paths)
+    convert = functools.partial(convert_to_json, **kwargs)
+    if workers == 1 or len(paths) <= 1:
+        return [convert(path) for path in paths]
+    # Imported here: concurrent.futures pulls in multiprocessing, which would
+    # otherwise slow down every import of this module
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Hand out files in chunks so small files don't pay one round-trip each
+        chunksize = max(1, len(paths) // (4 * (workers or os.cpu_count() or 1)))
+        return list(pool.map(convert, paths, chunksize=chunksize))
+
+
+def _dumps_indented(data: Any) -> str:
+    """Serialize to 2-space indented JSON, with orjson when installed; NaN/Infinity become null."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY).decode()
+        except TypeError:  # e.g. non-str keys or out-of-range ints; the stdlib encoder copes
+            pass
+    try:
+        return json.dumps(data, indent=2, allow_nan=False)
+    except ValueError:
+        # Match orjson, which writes non-finite floats as null
+        return json.dumps(_finite_or_none(data), indent=2)
+
+
+def _finite_or_none(obj: Any) -> Any:
+    """Copy obj with NaN and infinite floats replaced by None."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite_or_none(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite_or_none(value) for value in obj]
+    return obj
+
+
+def load_characterization_data(**kwargs: Any) -> Dict[str, Any]:
     """
     Load characterization data from various sources (DataFrames, arrays, dicts).
     
@@ -1302,7 +1566,9 @@ def load_characterization_data(**kwargs) -> Dict[str, Any]:
             - tga_data: List of [temperature, weight%] pairs or dict
             
             - aif_df: DataFrame with columns ['pressure', 'loading', 'p0' (optional)]
-            - aif_data: Dict with 'properties' and 'adsorptionData'
+            - aif_data: Dict with 'properties' and 'adsorptionData', or with parallel
+              'pressure'/'loading' (and optional 'p0') arrays, or a NumPy record
+              array with those fields (see mpif_analytics.aif_from_arrays)
             - aif_properties: Dict of AIF metadata (sample_id, temperature_K, etc.)
     
     Returns:
@@ -1336,11 +1602,11 @@ def load_characterization_data(**kwargs) -> Dict[str, Any]:
             aif_data=aif_dict
         )
     """
-    characterization = {}
+    characterization: Dict[str, Any] = {}
     
     # Handle PXRD data
     if 'pxrd_df' in kwargs or 'pxrd_data' in kwargs:
-        pxrd = {}
+        pxrd: Dict[str, Any] = {}
         
         # Source and wavelength
         if 'pxrd_source' in kwargs:
@@ -1350,13 +1616,7 @@ def load_characterization_data(**kwargs) -> Dict[str, Any]:
         
         # Data from DataFrame
         if 'pxrd_df' in kwargs:
-            df = kwargs['pxrd_df']
-            pxrd['data'] = []
-            for _, row in df.iterrows():
-                pxrd['data'].append({
-                    'twoTheta': float(row['twoTheta']),
-                    'intensity': float(row['intensity'])
-                })
+            pxrd['data'] = _frame_to_points(kwargs['pxrd_df'], ('twoTheta', 'intensity'))
         
         # Data from dict or list
         elif 'pxrd_data' in kwargs:
@@ -1382,16 +1642,11 @@ def load_characterization_data(**kwargs) -> Dict[str, Any]:
     
     # Handle TGA data
     if 'tga_df' in kwargs or 'tga_data' in kwargs:
-        tga = {'data': []}
+        tga: Dict[str, Any] = {'data': []}
         
         # Data from DataFrame
         if 'tga_df' in kwargs:
-            df = kwargs['tga_df']
-            for _, row in df.iterrows():
-                tga['data'].append({
-                    'temperature': float(row['temperature']),
-                    'weightPercent': float(row['weightPercent'])
-                })
+            tga['data'] = _frame_to_points(kwargs['tga_df'], ('temperature', 'weightPercent'))
         
         # Data from dict or list
         elif 'tga_data' in kwargs:
@@ -1414,7 +1669,7 @@ def load_characterization_data(**kwargs) -> Dict[str, Any]:
     
     # Handle AIF data
     if 'aif_df' in kwargs or 'aif_data' in kwargs:
-        aif = {
+        aif: Dict[str, Any] = {
             'dataName': '',
             'properties': kwargs.get('aif_properties', {}),
             'adsorptionData': [],
@@ -1424,14 +1679,8 @@ def load_characterization_data(**kwargs) -> Dict[str, Any]:
         # Data from DataFrame
         if 'aif_df' in kwargs:
             df = kwargs['aif_df']
-            for _, row in df.iterrows():
-                point = {
-                    'pressure': float(row['pressure']),
-                    'loading': float(row['loading'])
-                }
-                if 'p0' in row:
-                    point['p0'] = float(row['p0'])
-                aif['adsorptionData'].append(point)
+            keys = ('pressure', 'loading', 'p0') if 'p0' in df.columns else ('pressure', 'loading')
+            aif['adsorptionData'] = _frame_to_points(df, keys)
         
         # Data from dict
         elif 'aif_data' in kwargs:
@@ -1443,8 +1692,16 @@ def load_characterization_data(**kwargs) -> Dict[str, Any]:
                     aif['dataName'] = data['dataName']
                 if 'adsorptionData' in data:
                     aif['adsorptionData'] = data['adsorptionData']
+                elif 'pressure' in data and 'loading' in data:
+                    # Columnar arrays (lists or NumPy) - transpose once into points
+                    keys = ('pressure', 'loading', 'p0') if 'p0' in data else ('pressure', 'loading')
+                    aif['adsorptionData'] = _columns_to_points(data, keys)
                 if 'desorptionData' in data:
                     aif['desorptionData'] = data['desorptionData']
+            elif getattr(getattr(data, 'dtype', None), 'names', None):
+                # NumPy structured/record array with pressure, loading (, p0) fields
+                keys = ('pressure', 'loading', 'p0') if 'p0' in data.dtype.names else ('pressure', 'loading')
+                aif['adsorptionData'] = _columns_to_points(data, keys)
         
         if aif['adsorptionData'] or aif['desorptionData']:
             characterization['aif'] = aif
@@ -1456,3 +1713,14 @@ def load_characterization_data(**kwargs) -> Dict[str, Any]:
         characterization['cif'] = kwargs['cif_string']
     
     return characterization
+
+
+def _columns_to_points(columns: Dict[str, Any], keys: Tuple[str, ...]) -> List[Dict[str, float]]:
+    """Transpose parallel column arrays (lists or NumPy arrays) into a list of point dicts."""
+    cols = [columns[k].tolist() if hasattr(columns[k], 'tolist') else columns[k] for k in keys]
+    return [dict(zip(keys, map(float, row))) for row in zip(*cols)]
+
+
+def _frame_to_points(df: Any, keys: Tuple[str, ...]) -> List[Dict[str, float]]:
+    """Convert the given DataFrame columns to a list of float point dicts in one bulk step."""
+    return [dict(zip(keys, row)) for row in df[list(keys)].to_numpy(dtype='float64').tolist()]
@@ -0,0 +1,20 @@
+import numpy as np
+import pytest
+
+from mpif_analytics import cif_atom_site_arrays, integrate_tga
+
+
+def test_cif_atom_site_arrays_maps_missing_values_to_nan():
+    cif = {'loops': [{
+        'headers': ['_atom_site_label', '_atom_site_fract_x', '_atom_site_occupancy'],
+        'data': [['Zn1', '0.1234(5)', '1'], ['O1', '?', '.']],
+    }]}
+    arrays = cif_atom_site_arrays(cif)
+    np.testing.assert_array_equal(arrays['_atom_site_fract_x'], [0.1234, np.nan])
+    np.testing.assert_array_equal(arrays['_atom_site_occupancy'], [1.0, np.nan])
+
+
+def test_integrate_tga_rejects_mismatched_shapes():
+    assert integrate_tga([0, 10], [100, 90]) == pytest.approx(950.0)
+    with pytest.raises(ValueError):
+        integrate_tga([0, 10, 20], [100, 90])
@@ -0,0 +1,142 @@
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+import mpif_converter
+from mpif_converter import convert_to_json, mpif_to_json
+
+
+def test_text_block_with_blank_line_inside():
+    mpif = "_mpif_procedure_full\n;\nStep 1\n\nStep 2\n;\n"
+    details = mpif_to_json(mpif)['synthesisDetails']
+    assert details['procedureFull'] == "Step 1\n\nStep 2"
+
+
+def test_text_block_after_blank_and_comment_lines():
+    mpif = "_mpif_synthesis_react_note\n\n# note follows\n;\nStir gently\n;\n"
+    assert mpif_to_json(mpif)['synthesisGeneral']['reactionNote'] == "Stir gently"
+
+
+def test_loop_rows_follow_loop_specs():
+    for (key, _, columns), (_, _, _, rows) in zip(mpif_converter._LOOP_SPECS, mpif_converter._LOOP_EMITTERS):
+        item = {field: f"<{field}>" for _, field, _ in columns}
+        assert rows([item]) == "\n" + "\t".join(item.values())
+        assert rows([{}]) == "\n" + "\t".join(default for _, _, default in columns)
+
+
+def test_convert_to_json_honors_json_file_with_positional_data(tmp_path):
+    json_file = tmp_path / 'override.json'
+    json_file.write_text(json.dumps({'metadata': {'dataName': 'from_file'}}))
+    base = {'metadata': {'dataName': 'base', 'name': 'A. Author'}, 'productInfo': {}}
+    data = convert_to_json(base, json_file=str(json_file))
+    assert data['metadata'] == {'dataName': 'from_file', 'name': 'A. Author'}
+
+
+@pytest.mark.parametrize('use_orjson', [True, False])
+def test_dumps_indented_writes_non_finite_floats_as_null(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(mpif_converter, 'orjson', None)
+    elif mpif_converter.orjson is None:
+        pytest.skip('orjson not installed')
+    text = mpif_converter._dumps_indented({'data': [float('nan'), float('inf'), 1.5]})
+    assert json.loads(text) == {'data': [None, None, 1.5]}
+
+
+def test_read_mpif_file_cache_is_bounded_and_optional(tmp_path, monkeypatch):
+    path = tmp_path / 'sample.mpif'
+    path.write_text("data_cached\n_mpif_product_name_common\t'MOF-5'\n")
+    real = str(path.resolve())
+    monkeypatch.setattr(mpif_converter, '_PARSE_CACHE', type(mpif_converter._PARSE_CACHE)())
+    monkeypatch.setattr(mpif_converter, '_parse_cache_chars', 0)
+
+    first = convert_to_json(str(path))
+    assert (real, True) in mpif_converter._PARSE_CACHE
+    first['productInfo']['commonName'] = 'changed'
+    assert convert_to_json(str(path))['productInfo']['commonName'] == 'MOF-5'
+
+    mpif_converter._PARSE_CACHE.clear()
+    convert_to_json(str(path), use_cache=False)
+    assert not mpif_converter._PARSE_CACHE
+
+    monkeypatch.setattr(mpif_converter, '_PARSE_CACHE_MAX_CHARS', 10)
+    convert_to_json(str(path))
+    assert not mpif_converter._PARSE_CACHE
+
+
+class _Sink:
+    """Minimal writer that is neither an io.TextIOBase nor an io.BufferedIOBase."""
+
+    def __init__(self):
+        self.chunks = []
+
+    def writelines(self, chunks):
+        self.chunks.extend(chunks)
+
+
+def test_write_mpif_text_and_binary_writers():
+    data = {'metadata': {'dataName': 'sink'}}
+    expected = mpif_converter.json_to_mpif(data)
+
+    text_sink = _Sink()
+    mpif_converter.write_mpif(data, text_sink)
+    assert "".join(text_sink.chunks) == expected
+
+    byte_sink = _Sink()
+    mpif_converter.write_mpif(data, byte_sink, binary=True)
+    assert b"".join(byte_sink.chunks) == expected.encode('utf-8')
+
+
+def test_mpif_to_json_reads_binary_file(tmp_path):
+    path = tmp_path / 'binary.mpif'
+    text = "data_bin\n_mpif_product_name_common\t'Cu-BTC é'\n_mpif_procedure_full\n;\nStep 1\n;\n"
+    path.write_bytes(text.replace('\n', '\r\n').encode('utf-8'))
+    with open(path, 'rb') as f:
+        data = mpif_to_json(f)
+    assert data == mpif_to_json(text)
+    assert data['productInfo']['commonName'] == 'Cu-BTC é'
+
+
+def test_format_points_defaults_missing_keys():
+    points = [{'twoTheta': 5.0, 'intensity': 10}, {'twoTheta': 6.5}]
+    assert mpif_converter._format_points(points[:1], 'twoTheta', 'intensity') == "\n5.0\t10"
+    assert mpif_converter._format_points(points, 'twoTheta', 'intensity') == "\n5.0\t10\n6.5\t"
+
+
+def test_convert_batch_in_worker_processes(tmp_path):
+    sample = Path(__file__).resolve().parents[2] / 'samples' / 'test.mpif'
+    first = tmp_path / 'first.mpif'
+    second = tmp_path / 'second.mpif'
+    first.write_text(sample.read_text())
+    second.write_text(sample.read_text().replace('data_', 'data_second_', 1))
+    paths = [str(first), str(second)]
+
+    results = mpif_converter.convert_batch(paths, workers=2, use_cache=False)
+    assert results == [convert_to_json(path, use_cache=False) for path in paths]
+    assert results[0]['metadata']['dataName'] != results[1]['metadata']['dataName']
+
+    with pytest.raises(ValueError):
+        mpif_converter.convert_batch([str(first), str(tmp_path / 'missing.mpif')], workers=2)
+
+
+@pytest.mark.parametrize('mode', ['w', 'wb'])
+def test_write_mpif_to_text_and_binary_files(tmp_path, mode):
+    data = {'metadata': {'dataName': 'file', 'name': 'Zoë'}}
+    path = tmp_path / 'out.mpif'
+    with open(path, mode, **({} if 'b' in mode else {'encoding': 'utf-8', 'newline': ''})) as f:
+        mpif_converter.write_mpif(data, f)
+    assert path.read_bytes() == mpif_converter.json_to_mpif(data).encode('utf-8')
+
+
+def test_write_mpif_to_string_and_bytes_io():
+    data = {'metadata': {'dataName': 'memory', 'name': 'Zoë'}}
+    expected = mpif_converter.json_to_mpif(data)
+
+    text = io.StringIO()
+    mpif_converter.write_mpif(data, text)
+    assert text.getvalue() == expected
+
+    raw = io.BytesIO()
+    mpif_converter.write_mpif(data, raw)
+    assert raw.getvalue() == expected.encode('utf-8')